@@ -5,30 +5,670 @@ import urllib3
 import requests
 from dotenv import load_dotenv
 import time
+import asyncio
 import mimetypes
 from pathlib import Path
+from datetime import datetime, timezone
 import json
+import csv
+import threading
+import sqlite3
+import socket
+import hashlib
+import itertools
+import random
+import secrets
+import pickle
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+try:
+    import httpx
+except ImportError:  # Only needed for the async engine
+    httpx = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Only needed for Parquet/Arrow exports
+    pyarrow = None
+
+try:
+    from yaml.cyaml import CParser as _YamlParser
+    YamlLoader = yaml.CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    _YamlParser = None
+    YamlLoader = yaml.SafeLoader
+
+if _YamlParser is not None:
+    class _StreamingYamlLoader(_YamlParser, Composer, SafeConstructor, Resolver):
+        """libyaml parser with PyYAML's composer, so items can be built one at a time"""
+
+        def __init__(self, stream):
+            _YamlParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+else:
+    _StreamingYamlLoader = yaml.SafeLoader
 
 # Load environment variables from .env file
 load_dotenv()
 
-def load_yaml_data(file_path):
-    """Load data from a YAML file"""
+# Local state (parsed YAML, file index, resumable uploads) lives here
+CACHE_DIR = Path.home() / ".cache" / "appwrite-client"
+YAML_CACHE_DIR = CACHE_DIR / "yaml"
+
+def _yaml_cache_path(file_path, kind):
+    """Cache file for a YAML file, keyed by its resolved path, mtime and size"""
+    stat = os.stat(file_path)
+    key = f"{kind}:{Path(file_path).resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    return YAML_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.pickle"
+
+def load_yaml_data(file_path, cache=False):
+    """Load data from a YAML file.
+
+    Uses libyaml's CSafeLoader when PyYAML was built with it. With cache=True the
+    parsed data is pickled under ~/.cache/appwrite-client/yaml, so loading the same
+    unchanged file again (same path, mtime and size) skips parsing entirely.
+    """
     try:
+        cache_path = _yaml_cache_path(file_path, "data") if cache else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as file:
+                    return pickle.load(file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass  # Unreadable cache entry: parse the file again
         with open(file_path, 'r') as file:
-            return yaml.safe_load(file)
+            data = yaml.load(file, Loader=YamlLoader)
+        if cache_path is not None:
+            _write_yaml_cache(cache_path, lambda out: pickle.dump(data, out, pickle.HIGHEST_PROTOCOL))
+        return data
     except Exception as e:
         print(f"Error loading YAML file: {str(e)}")
         sys.exit(1)
 
-def create_session(email, password, project_id, endpoint, verify_ssl=True):
-    """Create an authenticated requests session"""
-    
-    # Create a requests session for handling cookies
-    session = requests.Session()
+def _write_yaml_cache(cache_path, write):
+    """Write a cache entry atomically; a failed write only costs the cache"""
+    temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'wb') as out:
+            write(out)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️ Could not cache parsed YAML: {str(e)}")
+        temp_path.unlink(missing_ok=True)
+
+def _iter_cached_documents(cache_path):
+    """Yield the items pickled one after another into a stream cache entry"""
+    with open(cache_path, 'rb') as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+def _parse_yaml_documents(file_path):
+    """Yield the items of a YAML file as they are parsed (see iter_yaml_documents)"""
+    with open(file_path, 'r') as file:
+        loader = _StreamingYamlLoader(file)
+        try:
+            loader.get_event()  # StreamStartEvent
+            while not loader.check_event(yaml.StreamEndEvent):
+                loader.get_event()  # DocumentStartEvent
+                if loader.check_event(yaml.SequenceStartEvent):
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, None))
+                    loader.get_event()  # SequenceEndEvent
+                else:
+                    yield loader.construct_document(loader.compose_node(None, None))
+                loader.get_event()  # DocumentEndEvent
+                # Anchors do not carry across documents
+                loader.anchors = {}
+        finally:
+            loader.dispose()
+
+def iter_yaml_documents(file_path, cache=False):
+    """Yield documents from a YAML file one at a time while it is being parsed.
+
+    A top-level list is yielded item by item; in a multi-document stream
+    (separated by ---) each document is yielded, or its items if it is a list.
+    Only the current item is built in memory, so callers can start sending data
+    before the rest of the file has been read. Parsing uses libyaml when available.
+
+    With cache=True each item is also pickled to the cache as it is yielded; once a
+    full pass has completed, later runs on the unchanged file stream the pickled
+    items back instead of parsing it again.
+    """
+    try:
+        if not cache:
+            yield from _parse_yaml_documents(file_path)
+            return
+        cache_path = _yaml_cache_path(file_path, "stream")
+        if cache_path.exists():
+            yield from _iter_cached_documents(cache_path)
+            return
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        out = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            out = open(temp_path, 'wb')
+        except OSError as e:
+            print(f"⚠️ Could not cache parsed YAML: {str(e)}")
+        try:
+            for item in _parse_yaml_documents(file_path):
+                if out is not None:
+                    pickle.dump(item, out, pickle.HIGHEST_PROTOCOL)
+                yield item
+            if out is not None:
+                out.close()
+                os.replace(temp_path, cache_path)
+                out = None
+        finally:
+            # Only a complete pass is cached; an interrupted one is discarded
+            if out is not None:
+                out.close()
+                temp_path.unlink(missing_ok=True)
+    except (OSError, yaml.YAMLError, pickle.UnpicklingError) as e:
+        print(f"Error loading YAML file: {str(e)}")
+        sys.exit(1)
+
+def iter_jsonl_documents(file_path):
+    """Yield one document per line of a newline-delimited JSON (JSONL) file.
+
+    Blank lines are skipped. Each line is parsed on its own, so memory stays flat
+    however large the file is.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Error loading JSONL file: line {line_number}: {str(e)}")
+                    sys.exit(1)
+    except OSError as e:
+        print(f"Error loading JSONL file: {str(e)}")
+        sys.exit(1)
+
+def _parse_boolean(value):
+    """Parse a CSV cell as a boolean"""
+    lowered = value.strip().lower()
+    if lowered in ("true", "1", "yes", "y"):
+        return True
+    if lowered in ("false", "0", "no", "n"):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+# Converters for typed CSV columns, named after Appwrite attribute types
+CSV_COLUMN_TYPES = {
+    "string": str,
+    "integer": int,
+    "float": float,
+    "boolean": _parse_boolean,
+    "json": json.loads,  # lists, objects or nested values, e.g. ["a", "b"]
+}
+
+def parse_column_types(spec):
+    """Parse a "column:type,column:type" string into a column type mapping"""
+    column_types = {}
+    for entry in filter(None, (part.strip() for part in (spec or "").split(","))):
+        column, separator, type_name = entry.rpartition(":")
+        if not separator or not column or type_name not in CSV_COLUMN_TYPES:
+            raise ValueError(f"Invalid column type {entry!r}; expected column:{'|'.join(CSV_COLUMN_TYPES)}")
+        column_types[column.strip()] = type_name
+    return column_types
+
+def iter_csv_documents(file_path, column_types=None):
+    """Yield one document per row of a CSV file with a header row.
+
+    Cells are strings unless column_types maps the column to one of
+    CSV_COLUMN_TYPES (e.g. {"price": "float", "tags": "json"}); an empty typed
+    cell becomes None. Rows are read one at a time.
+    """
+    column_types = column_types or {}
+    unknown = set(column_types.values()) - set(CSV_COLUMN_TYPES)
+    if unknown:
+        print(f"Error loading CSV file: unknown column types {sorted(unknown)}")
+        sys.exit(1)
+    try:
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as file:
+            reader = csv.DictReader(file)
+            missing = set(column_types) - set(reader.fieldnames or [])
+            if missing:
+                print(f"⚠️ Typed columns not found in CSV header: {', '.join(sorted(missing))}")
+            for row in reader:
+                document = {}
+                for column, value in row.items():
+                    type_name = column_types.get(column)
+                    if type_name is None or value is None:
+                        document[column] = value
+                    elif value == "":
+                        document[column] = None
+                    else:
+                        try:
+                            document[column] = CSV_COLUMN_TYPES[type_name](value)
+                        except ValueError as e:
+                            print(f"Error loading CSV file: line {reader.line_num}, column {column!r}: {str(e)}")
+                            sys.exit(1)
+                yield document
+    except (OSError, csv.Error) as e:
+        print(f"Error loading CSV file: {str(e)}")
+        sys.exit(1)
+
+INPUT_FORMATS = ("yaml", "jsonl", "csv")
+
+def detect_input_format(file_path):
+    """Guess the input format from the file extension (YAML unless .jsonl/.ndjson/.csv)"""
+    suffix = Path(file_path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    return "yaml"
+
+def iter_input_documents(file_path, input_format=None, column_types=None, yaml_cache=False):
+    """Stream documents from a YAML, JSONL or CSV file.
+
+    input_format defaults to a guess from the file extension. column_types only
+    applies to CSV and yaml_cache only to YAML.
+    """
+    input_format = input_format or detect_input_format(file_path)
+    if input_format == "jsonl":
+        return iter_jsonl_documents(file_path)
+    if input_format == "csv":
+        return iter_csv_documents(file_path, column_types)
+    if input_format == "yaml":
+        return iter_yaml_documents(file_path, cache=yaml_cache)
+    raise ValueError(f"Unknown input format: {input_format}")
+
+def _batched(iterable, size):
+    """Yield lists of up to size items from an iterable without materialising it"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _bounded_map(executor, function, iterable, window):
+    """Like executor.map, but submits at most window items ahead of the consumer.
+
+    Results are yielded in input order and the input is read lazily, so a
+    streamed source is never pulled into memory all at once.
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(function, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+@contextmanager
+def _ordered_map(session, function, iterable, concurrency):
+    """Map function over iterable from a pool of concurrency workers, in input order.
+
+    The session's connection pool is sized to match and the input is read
+    lazily (see _bounded_map); with concurrency <= 1 this is a plain map. The
+    workers are shut down when the block exits.
+    """
+    if concurrency <= 1:
+        yield map(function, iterable)
+        return
+    configure_connection_pool(session, concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        yield _bounded_map(executor, function, iterable, concurrency * 2)
+
+class RateLimiter:
+    """Token bucket shared by bulk operations and tuned from Appwrite responses.
+
+    The refill rate is halved on HTTP 429 and requests are held until the
+    X-RateLimit-Reset time (or Retry-After); clean responses ramp the rate back
+    up, capped by the budget left in X-RateLimit-Remaining for the current window.
+    """
+
+    def __init__(self, rate=5.0, min_rate=0.5, max_rate=200.0, increase=1.0, decrease=0.5):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._blocked_until:
+                    capacity = max(1.0, self.rate / 10)
+                    self._tokens = min(capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._blocked_until - now
+            time.sleep(wait)
+
+    def observe(self, response):
+        """Adjust the rate from a response's status code and rate-limit headers"""
+        remaining = _header_number(response, "X-RateLimit-Remaining")
+        reset_in = _seconds_until(_header_number(response, "X-RateLimit-Reset"))
+        with self._lock:
+            now = time.monotonic()
+            if response.status_code == 429:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                pause = reset_in
+                if pause is None:
+                    pause = _header_number(response, "Retry-After")
+                if pause is None:
+                    pause = 1 / self.rate
+                self._block(now + max(pause, 1 / self.rate))
+                return
+
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            if remaining is not None and reset_in is not None:
+                if remaining <= 0:
+                    self._block(now + reset_in)
+                else:
+                    # Spread what is left of the window over the time until it resets
+                    budget = remaining / max(reset_in, 1.0)
+                    self.rate = max(self.min_rate, min(self.rate, budget))
+
+    def _block(self, until):
+        self._blocked_until = max(self._blocked_until, until)
+        self._tokens = 0.0
+
+def _header_number(response, name):
+    """Read a numeric response header, returning None when missing or invalid"""
+    value = response.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+def _seconds_until(reset):
+    """Convert an X-RateLimit-Reset value (epoch seconds or a delta) to seconds from now"""
+    if reset is None:
+        return None
+    if reset > 1e9:
+        return max(0.0, reset - time.time())
+    return max(0.0, reset)
+
+_default_rate_limiter = None
+
+def get_default_rate_limiter():
+    """Return the rate limiter shared by bulk operations in this process"""
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        _default_rate_limiter = RateLimiter()
+    return _default_rate_limiter
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter and a retry budget shared by a whole run.
+
+    The n-th retry of a request waits a random time between 0 and
+    min(max_delay, base_delay * 2 ** (n - 1)) seconds (or the server's Retry-After,
+    if longer). Once budget retries have been spent across all requests, failures
+    are returned to the caller straight away instead of stalling a broken run.
+    """
+
+    def __init__(self, max_attempts=5, base_delay=0.5, max_delay=30.0, budget=200,
+                 statuses=(500, 502, 503, 504)):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.statuses = frozenset(statuses)
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def allow(self, attempt):
+        """Take a retry from the budget if the attempt that just failed may be retried"""
+        if attempt >= self.max_attempts:
+            return False
+        with self._lock:
+            if self.retries >= self.budget:
+                if self.retries == self.budget:
+                    self.retries += 1  # Only warn once
+                    print(f"⚠️ Retry budget of {self.budget} exhausted, no longer retrying failed requests")
+                return False
+            self.retries += 1
+            return True
+
+    def backoff(self, attempt, response=None):
+        """Seconds to wait before retrying after the given failed attempt"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        retry_after = _header_number(response, "Retry-After") if response is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+_default_retry_policy = None
+
+def get_default_retry_policy():
+    """Return the retry policy (and budget) shared by requests in this process"""
+    global _default_retry_policy
+    if _default_retry_policy is None:
+        _default_retry_policy = RetryPolicy()
+    return _default_retry_policy
+
+def new_id():
+    """Generate a document/file ID client-side in the same format as Appwrite's unique()"""
+    return secrets.token_hex(10)
+
+# Repeating one of these has the same effect as sending it once
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+def _send_request(session, method, url, rate_limiter=None, max_attempts=5, retry_policy=None, idempotent=None, **kwargs):
+    """Send a request through the rate limiter and the retry policy.
+
+    HTTP 429 responses are resent (up to max_attempts times) once the limiter has
+    backed off. Transient failures (5xx gateway errors, timeouts, dropped
+    connections) are retried with backoff only when repeating the request is
+    safe: GET/HEAD/PUT/DELETE, or a create under a client-chosen ID, which
+    callers mark with idempotent=True. A connect timeout is always retried,
+    since the request never reached the server.
+    """
+    limiter = rate_limiter or get_default_rate_limiter()
+    policy = retry_policy or get_default_retry_policy()
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    rate_limited = 0
+    failures = 0
+    while True:
+        # Rewind any file bodies consumed by a previous attempt
+        for value in (kwargs.get("files") or {}).values():
+            if isinstance(value, tuple) and hasattr(value[1], "seek"):
+                value[1].seek(0)
+        limiter.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            failures += 1
+            if not (idempotent or isinstance(e, requests.ConnectTimeout)) or not policy.allow(failures):
+                raise
+            delay = policy.backoff(failures)
+            print(f"🔁 {method} {url} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+        limiter.observe(response)
+        if response.status_code == 429:
+            rate_limited += 1
+            if rate_limited >= max_attempts:
+                return response
+            print(f"⏳ Rate limited by Appwrite (attempt {rate_limited}/{max_attempts}), backing off to {limiter.rate:.1f} req/s")
+            # Hand a streamed response's connection back to the pool before retrying
+            response.close()
+            continue
+        if idempotent and response.status_code in policy.statuses:
+            failures += 1
+            if policy.allow(failures):
+                delay = policy.backoff(failures, response)
+                print(f"🔁 {method} {url} returned HTTP {response.status_code}, retrying in {delay:.1f}s")
+                response.close()
+                time.sleep(delay)
+                continue
+        return response
+
+# Connections kept open per host; bulk operations grow this to their worker count
+DEFAULT_POOL_SIZE = 20
+# (connect, read) seconds; a stalled socket fails after this instead of hanging forever
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+def keepalive_socket_options(idle=60, interval=15, count=4):
+    """Socket options enabling TCP keep-alive probes, on top of urllib3's defaults.
+
+    An idle pooled connection is probed after idle seconds, so connections dropped
+    by a NAT or load balancer are noticed instead of surfacing as a stalled request.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Linux names; macOS calls the idle time TCP_KEEPALIVE
+    idle_option = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+    for option, value in ((idle_option, idle), (getattr(socket, "TCP_KEEPINTVL", None), interval),
+                          (getattr(socket, "TCP_KEEPCNT", None), count)):
+        if option is not None:
+            options.append((socket.IPPROTO_TCP, option, value))
+    return options
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use TCP keep-alive (see keepalive_socket_options)"""
+
+    def __init__(self, socket_options=None, **kwargs):
+        self.socket_options = socket_options if socket_options is not None else keepalive_socket_options()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to requests that do not set one"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+def create_transport_session(verify_ssl=True, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, keepalive=True, adapter=None):
+    """Create an unauthenticated session with a tuned transport.
+
+    pool_size connections are kept warm per host and every request gets a
+    (connect, read) timeout. keepalive mounts a KeepAliveAdapter; pass your own
+    adapter (any requests HTTPAdapter) to replace it entirely.
+    """
+    session = TimeoutSession(timeout=timeout)
     if not verify_ssl:
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         session.verify = False
+    if adapter is None:
+        adapter_class = KeepAliveAdapter if keepalive else HTTPAdapter
+        adapter = adapter_class(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+SESSION_CACHE_PATH = CACHE_DIR / "sessions.json"
+# Log in again when a cached session has less than this many seconds left
+SESSION_EXPIRY_MARGIN = 300
+_session_cache_lock = threading.Lock()
+
+def _read_session_cache():
+    try:
+        return json.loads(SESSION_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _write_session_cache(cache):
+    """Write the session cache readable by the current user only"""
+    SESSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = SESSION_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as file:
+        json.dump(cache, file)
+    os.replace(temp_path, SESSION_CACHE_PATH)
+
+def _session_cache_key(email, project_id, endpoint):
+    return f"{endpoint}|{project_id}|{email}"
+
+def _store_cached_session(session, key, expire):
+    """Save the session cookies and their expiry (never the password)"""
+    cookies = [{"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path}
+               for cookie in session.cookies]
+    with _session_cache_lock:
+        cache = _read_session_cache()
+        cache[key] = {"cookies": cookies, "expire": expire}
+        try:
+            _write_session_cache(cache)
+        except OSError as e:
+            print(f"⚠️ Could not cache session: {str(e)}")
+
+def _restore_cached_session(session, key, project_id, endpoint):
+    """Load cached cookies into session if they are unexpired and still accepted by Appwrite"""
+    with _session_cache_lock:
+        entry = _read_session_cache().get(key)
+    if not entry:
+        return False
+    try:
+        expire = datetime.fromisoformat(entry["expire"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    if (expire - datetime.now(timezone.utc)).total_seconds() < SESSION_EXPIRY_MARGIN:
+        return False
+    for cookie in entry.get("cookies", []):
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+    # A cheap authenticated read catches sessions deleted server-side (logout, password change)
+    try:
+        response = _send_request(session, "GET", f"{endpoint}/account", headers={"X-Appwrite-Project": project_id})
+    except requests.RequestException:
+        response = None
+    if response is not None and response.status_code == 200:
+        return True
+    session.cookies.clear()
+    return False
+
+def create_session(email, password, project_id, endpoint, verify_ssl=True, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, keepalive=True, adapter=None, cache_session=False):
+    """Create an authenticated requests session.
+
+    Transport settings (pool size, timeouts, keep-alive, a custom adapter) are
+    passed on to create_transport_session.
+
+    With cache_session=True the session cookies are saved with their expiry in
+    ~/.cache/appwrite-client/sessions.json (mode 0600) and reused by later calls
+    for the same endpoint, project and email, so the login request is only made
+    when there is no valid session left.
+    """
+    
+    # Create a requests session for handling cookies
+    session = create_transport_session(verify_ssl=verify_ssl, pool_size=pool_size, timeout=timeout,
+                                       keepalive=keepalive, adapter=adapter)
+    
+    cache_key = _session_cache_key(email, project_id, endpoint)
+    if cache_session and _restore_cached_session(session, cache_key, project_id, endpoint):
+        print("✅ Reusing cached session")
+        return session
     
     # Login
     login_url = f"{endpoint}/account/sessions/email"
@@ -47,9 +687,23 @@ def create_session(email, password, project_id, endpoint, verify_ssl=True):
         print(f"❌ Login failed: {response.text}")
         return None
     
+    if cache_session:
+        _store_cached_session(session, cache_key, response.json().get("expire"))
+    
     print(f"✅ Login successful!")
     return session
 
+def create_api_key_session(project_id, api_key, verify_ssl=True, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, keepalive=True, adapter=None):
+    """Create a session authenticated with an Appwrite API key instead of a login.
+
+    The key is sent as X-Appwrite-Key on every request, so no session is created
+    and login rate limits do not apply. The key's scopes decide what it may do.
+    """
+    session = create_transport_session(verify_ssl=verify_ssl, pool_size=pool_size, timeout=timeout,
+                                       keepalive=keepalive, adapter=adapter)
+    session.headers.update({"X-Appwrite-Project": project_id, "X-Appwrite-Key": api_key})
+    return session
+
 def test_connection_with_session(session, project_id, endpoint):
     """Test connection to Appwrite by listing databases using requests session"""
     print("Testing connection to Appwrite...")
@@ -136,6 +790,79 @@ def get_collection_documents_with_session(session, project_id, database_id, coll
     print(f"✅ Found {documents['total']} documents in collection")
     return documents
 
+def _query(method, attribute=None, values=None):
+    """Build an Appwrite query string (JSON format used by Appwrite 1.5+)"""
+    query = {"method": method}
+    if attribute is not None:
+        query["attribute"] = attribute
+    if values is not None:
+        query["values"] = values
+    return json.dumps(query)
+
+def _iter_cursor_pages(session, url, project_id, result_key, page_size=100, queries=None, prefetch=True):
+    """Yield pages from an Appwrite list endpoint using limit/cursorAfter queries.
+
+    Shared by the document and storage listings. Only one page is held in memory at
+    a time; with prefetch enabled the next page is requested in the background
+    while the caller processes the current one. A page that fails to load raises
+    requests.HTTPError instead of ending the iteration, so a partial listing is
+    never mistaken for the whole collection.
+    """
+    headers = {
+        "X-Appwrite-Project": project_id
+    }
+    
+    def fetch(cursor):
+        page_queries = list(queries or []) + [_query("limit", values=[page_size])]
+        if cursor:
+            page_queries.append(_query("cursorAfter", values=[cursor]))
+        response = _send_request(session, "GET", url, headers=headers, params={"queries[]": page_queries})
+        if response.status_code != 200:
+            raise requests.HTTPError(f"Failed to fetch {result_key} after cursor {cursor}: {response.text}",
+                                     response=response)
+        return response.json().get(result_key, [])
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = fetch(None)
+        while page:
+            next_page = None
+            if len(page) == page_size:
+                cursor = page[-1]["$id"]
+                next_page = executor.submit(fetch, cursor) if prefetch else cursor
+            yield page
+            if next_page is None:
+                break
+            page = next_page.result() if prefetch else fetch(next_page)
+
+def iter_collection_pages(session, project_id, database_id, collection_id, endpoint, page_size=100, queries=None, prefetch=True):
+    """Yield every page of documents in a collection using cursor pagination.
+
+    Extra queries (filters, select) are applied to every page.
+    """
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    return _iter_cursor_pages(session, url, project_id, "documents",
+                              page_size=page_size, queries=queries, prefetch=prefetch)
+
+def iter_collection_documents(session, project_id, database_id, collection_id, endpoint, page_size=100, queries=None, prefetch=True):
+    """Yield every document in a collection one at a time using cursor pagination"""
+    for page in iter_collection_pages(session, project_id, database_id, collection_id, endpoint,
+                                      page_size=page_size, queries=queries, prefetch=prefetch):
+        yield from page
+
+def get_documents_by_ids(session, project_id, database_id, collection_id, document_ids, endpoint, batch_size=100):
+    """Fetch many documents by ID with batched equal("$id", [...]) queries.
+
+    Returns a map of document ID -> document; IDs that do not exist are absent.
+    """
+    document_ids = list(document_ids)
+    documents = {}
+    for i in range(0, len(document_ids), batch_size):
+        batch = document_ids[i:i + batch_size]
+        for doc in iter_collection_documents(session, project_id, database_id, collection_id, endpoint,
+                                             queries=[_query("equal", "$id", batch)], prefetch=False):
+            documents[doc["$id"]] = doc
+    return documents
+
 def get_collection_id_by_name(session, project_id, database_id, target_name, endpoint):
     """Retrieve a collection's ID by its name using the Appwrite REST API."""
     url = f"{endpoint}/databases/{database_id}/collections"
@@ -153,8 +880,22 @@ def get_collection_id_by_name(session, project_id, database_id, target_name, end
     print(f"Collection with name '{target_name}' not found.")
     return None
 
-def create_document_with_session(session, project_id, database_id, collection_id, data, endpoint):
-    """Create a document using an existing session"""
+def _stored_document(session, doc_url, headers, document_id, rate_limiter=None):
+    """After a 409 on create, return the document stored under document_id, or None.
+
+    Appwrite answers 409 both when the ID is taken (e.g. by an earlier attempt
+    whose response was lost) and when the row breaks a unique index; only in the
+    first case does the ID exist.
+    """
+    response = _send_request(session, "GET", f"{doc_url}/{document_id}", rate_limiter=rate_limiter, headers=headers)
+    return response.json() if response.status_code == 200 else None
+
+def create_document_with_session(session, project_id, database_id, collection_id, data, endpoint, document_id=None):
+    """Create a document using an existing session.
+
+    Without a document_id the ID is generated client-side (see new_id), so the
+    create is always safe to repeat and transient failures are retried.
+    """
     
     # Create document
     doc_url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
@@ -163,74 +904,284 @@ def create_document_with_session(session, project_id, database_id, collection_id
         "Content-Type": "application/json"
     }
     
-    # Use 'unique()' as document ID to let Appwrite generate a unique ID
+    generated_id = document_id is None
     doc_data = {
-        "documentId": "unique()",
+        "documentId": document_id or new_id(),
         "data": data
     }
     
-    doc_response = session.post(doc_url, headers=doc_headers, json=doc_data)
+    doc_response = _send_request(session, "POST", doc_url, idempotent=True, headers=doc_headers, json=doc_data)
     
-    if doc_response.status_code != 201:
+    result = None
+    if doc_response.status_code == 201:
+        result = doc_response.json()
+    elif doc_response.status_code == 409 and generated_id:
+        # A retried attempt that had already been stored, unless a unique index conflicts
+        result = _stored_document(session, doc_url, doc_headers, doc_data["documentId"])
+    
+    if result is None:
         print(f"❌ Failed to create document: {doc_response.text}")
         return None
     
-    result = doc_response.json()
     print(f"✅ Document created successfully with ID: {result['$id']}")
     return result
 
-def bulk_create_documents_with_session(session, yaml_file, project_id, database_id, collection_id, endpoint):
-    """Create documents in bulk from YAML data using an existing session"""
-    # Load data from YAML
-    data = load_yaml_data(yaml_file)
+def configure_connection_pool(session, pool_size):
+    """Make sure the session keeps at least pool_size connections open per host.
+
+    Mounted adapters are resized in place, so custom adapters and their socket
+    options are kept; pools that are already large enough are left alone.
+    """
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, HTTPAdapter) and adapter._pool_maxsize < pool_size:
+            adapter.poolmanager.clear()
+            adapter._pool_connections = max(adapter._pool_connections, pool_size)
+            adapter._pool_maxsize = pool_size
+            adapter.init_poolmanager(adapter._pool_connections, pool_size, block=adapter._pool_block)
+    return session
+
+# Largest batch accepted by Appwrite's bulk documents endpoint (APP_LIMIT_DATABASE_BATCH)
+MAX_DOCUMENT_BATCH_SIZE = 100
+
+def _is_bulk_unsupported(response):
+    """Check whether a failed batched create means the server has no bulk documents endpoint"""
+    if response.status_code in (404, 405):
+        return True
+    # Older servers parse the batch as a single-document create and miss its params
+    return response.status_code == 400 and ("documentId" in response.text or '"data"' in response.text)
+
+def _row_hash(document_data):
+    """Stable hash of an input row, independent of key order"""
+    encoded = json.dumps(document_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+def deterministic_document_id(document_data):
+    """Document ID derived from a row's content, so re-sending the row cannot duplicate it.
+
+    Rows with identical content map to the same ID and are created only once.
+    """
+    # Appwrite IDs are at most 36 characters and must not start with a special character
+    return _row_hash(document_data)[:32]
+
+def default_journal_path(file_path, endpoint, project_id, database_id, collection_id):
+    """Journal location for importing file_path into a collection"""
+    key = f"{Path(file_path).resolve()}:{endpoint}:{project_id}:{database_id}:{collection_id}"
+    return CACHE_DIR / "journals" / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.jsonl"
+
+class ImportJournal:
+    """Append-only JSONL log of bulk import results (input index -> document ID and status).
+
+    A row counts as finished when its latest entry is a success recorded for the
+    same row content, so re-running an import skips finished rows and retries
+    failures; rows edited since the last run are sent again.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._finished = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn last line from an interrupted run
+                    if entry.get("status") in ("created", "exists"):
+                        self._finished[entry["index"]] = (entry["hash"], entry.get("id"))
+                    else:
+                        self._finished.pop(entry["index"], None)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def __len__(self):
+        return len(self._finished)
+
+    def finished_id(self, index, row_hash):
+        """Document ID a finished row was stored under, or None if the row still needs sending"""
+        entry = self._finished.get(index)
+        if entry is None or entry[0] != row_hash:
+            return None
+        return entry[1]
+
+    def record(self, index, row_hash, status, document_id=None, error=None):
+        """Append one result and flush it, so it survives the process dying right after"""
+        entry = {"index": index, "hash": row_hash, "status": status, "id": document_id}
+        if error is not None:
+            entry["error"] = error
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            if status in ("created", "exists"):
+                self._finished[index] = (row_hash, document_id)
+            else:
+                self._finished.pop(index, None)
+
+    def close(self):
+        self._file.close()
+
+def bulk_create_documents_with_session(session, yaml_file, project_id, database_id, collection_id, endpoint, concurrency=1, rate_limiter=None, batch_size=None, yaml_cache=False, input_format=None, column_types=None, journal=None, deterministic_ids=False):
+    """Create documents in bulk from YAML data using an existing session.
+
+    With concurrency > 1 the POSTs are sent from a bounded thread pool sharing the
+    session's connection pool; results are still reported in YAML order. Requests
+    are paced by rate_limiter (the shared default limiter if not given).
+
+    With batch_size set, documents are sent batch_size at a time through Appwrite's
+    bulk documents endpoint. A rejected batch is retried one document at a time so
+    failures are reported against their YAML index, and servers without the bulk
+    endpoint fall back to per-document POSTs. Batched documents carry client-side
+    IDs, so a batch whose response was lost is never created a second time.
+
+    The input is streamed with iter_input_documents, so memory stays flat and
+    the first request goes out before the file has been fully parsed. yaml_file
+    may also be a JSONL or CSV file (see input_format and column_types). With
+    yaml_cache=True a re-run on an unchanged YAML file skips parsing it again.
+
+    With a journal (an ImportJournal or a path to one), every result is logged as
+    it arrives and rows already created by an earlier run are skipped, so an
+    interrupted import can simply be run again. Every document gets a
+    client-side ID, so a create whose response is lost is retried safely.
+    deterministic_ids derives that ID from the row's content instead of
+    generating it; a row whose ID already exists (HTTP 409) is then counted as
+    done rather than duplicated.
+    """
+    # Stream data from the input file
+    data = iter_input_documents(yaml_file, input_format, column_types, yaml_cache)
+    
+    opened_journal = journal is not None and not isinstance(journal, ImportJournal)
+    if opened_journal:
+        journal = ImportJournal(journal)
     
     # Process documents
     successful = 0
     failed = 0
+    skipped = 0
     errors = []
     
     print(f"Starting bulk upload to database ID: {database_id}, collection ID: {collection_id}")
     
-    for idx, document_data in enumerate(data, 1):
+    doc_url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    doc_headers = {
+        "X-Appwrite-Project": project_id,
+        "Content-Type": "application/json"
+    }
+    
+    def create_one(row):
+        """POST one document and return (result, error_text)"""
+        _, document_data, _, document_id = row
         try:
-            # Create document
-            doc_url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
-            doc_headers = {
-                "X-Appwrite-Project": project_id,
-                "Content-Type": "application/json"
-            }
-            
-            # Use 'unique()' as document ID to let Appwrite generate a unique ID
             doc_data = {
-                "documentId": "unique()",
+                "documentId": document_id,
                 "data": document_data
             }
             
-            doc_response = session.post(doc_url, headers=doc_headers, json=doc_data)
+            doc_response = _send_request(session, "POST", doc_url, rate_limiter=rate_limiter,
+                                         idempotent=True, headers=doc_headers, json=doc_data)
             
+            # The ID is taken by an earlier attempt (a retry, a batch whose response was
+            # lost, or with deterministic_ids an earlier run that died before journaling
+            # it) only if it can be read back; otherwise a unique index conflicts
+            if doc_response.status_code == 409:
+                stored = _stored_document(session, doc_url, doc_headers, document_id, rate_limiter)
+                if stored is None:
+                    return None, doc_response.text
+                if deterministic_ids:
+                    return {"$id": document_id, "$exists": True}, None
+                return stored, None
             if doc_response.status_code != 201:
-                failed += 1
-                error_msg = f"Error creating document {idx}: {doc_response.text}"
-                errors.append(error_msg)
-                print(error_msg)
-                continue
-            
-            result = doc_response.json()
-            successful += 1
-            print(f"Created document {idx}/{len(data)}: ID {result['$id']}")
-            
+                return None, doc_response.text
+            return doc_response.json(), None
         except Exception as e:
-            failed += 1
-            error_msg = f"Error creating document {idx}: {str(e)}"
-            errors.append(error_msg)
-            print(error_msg)
-        time.sleep(0.2)
+            return None, str(e)
+    
+    bulk_supported = [True]
+    
+    def create_batch(rows):
+        """POST a batch of documents in one request and return a (result, error_text) per item"""
+        # Every item has a client-side ID, so if the batch was stored but its response
+        # lost, the per-document fallback below gets a 409 instead of a duplicate
+        if bulk_supported[0]:
+            batch = [dict(document_data, **{"$id": document_id})
+                     for _, document_data, _, document_id in rows]
+            try:
+                response = _send_request(session, "POST", doc_url, rate_limiter=rate_limiter,
+                                         idempotent=True, headers=doc_headers,
+                                         json={"documents": batch})
+                if response.status_code == 201:
+                    created = response.json().get("documents", [])
+                    if len(created) == len(batch):
+                        return [(result, None) for result in created]
+                elif _is_bulk_unsupported(response):
+                    if bulk_supported[0]:
+                        print("Server does not support batched document creation, falling back to per-document requests")
+                    bulk_supported[0] = False
+            except Exception as e:
+                print(f"Batched create failed ({str(e)}), retrying documents individually")
+        # Isolate the failing documents by sending the batch one at a time
+        return [create_one(row) for row in rows]
+    
+    def journaled(task):
+        """Wrap task so each result is journaled by the worker as soon as it arrives"""
+        def run(rows):
+            outcomes = task(rows)
+            if journal is not None:
+                for (idx, _, row_hash, _), (result, error) in zip(rows, outcomes):
+                    if error is not None:
+                        journal.record(idx, row_hash, "failed", error=error)
+                    else:
+                        journal.record(idx, row_hash, "exists" if result.get("$exists") else "created", result["$id"])
+            return list(zip(rows, outcomes))
+        return run
+    
+    def pending_rows():
+        """Yield (index, data, row hash, document ID) for rows that still need creating"""
+        nonlocal skipped
+        for idx, document_data in enumerate(data, 1):
+            row_hash = _row_hash(document_data) if journal is not None or deterministic_ids else None
+            if journal is not None and journal.finished_id(idx, row_hash) is not None:
+                skipped += 1
+                continue
+            document_id = deterministic_document_id(document_data) if deterministic_ids else new_id()
+            yield idx, document_data, row_hash, document_id
+    
+    if batch_size:
+        batch_size = min(batch_size, MAX_DOCUMENT_BATCH_SIZE)
+        work = _batched(pending_rows(), batch_size)
+        task = journaled(create_batch)
+    else:
+        work = ([row] for row in pending_rows())
+        task = journaled(lambda rows: [create_one(rows[0])])
+    
+    try:
+        # Results come back in input order, so reporting stays in YAML order
+        with _ordered_map(session, task, work, concurrency) as grouped:
+            for (idx, *_), (result, error) in (outcome for group in grouped for outcome in group):
+                if error is not None:
+                    failed += 1
+                    error_msg = f"Error creating document {idx}: {error}"
+                    errors.append(error_msg)
+                    print(error_msg)
+                elif result.get("$exists"):
+                    skipped += 1
+                    print(f"Document {idx} already exists: ID {result['$id']}")
+                else:
+                    successful += 1
+                    print(f"Created document {idx}: ID {result['$id']}")
+    finally:
+        if opened_journal:
+            journal.close()
     
     # Print summary
     print("\n--- Upload Summary ---")
-    print(f"Total documents: {len(data)}")
+    print(f"Total documents: {successful + failed + skipped}")
     print(f"Successfully created: {successful}")
+    if skipped:
+        print(f"Skipped (already created): {skipped}")
     print(f"Failed: {failed}")
+    if journal is not None:
+        print(f"Journal: {journal.path}")
     
     if errors:
         print("\nErrors encountered:")
@@ -241,7 +1192,7 @@ def delete_document_with_session(session, project_id, database_id, collection_id
     """Delete a specific document using an existing session."""
     url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents/{document_id}"
     headers = {"X-Appwrite-Project": project_id}
-    response = session.delete(url, headers=headers)
+    response = _send_request(session, "DELETE", url, headers=headers)
     if response.status_code == 204:
         print(f"✅ Document {document_id} deleted successfully.")
         return True
@@ -249,15 +1200,114 @@ def delete_document_with_session(session, project_id, database_id, collection_id
         print(f"❌ Failed to delete document {document_id}: {response.text}")
         return False
 
-def delete_all_documents_with_session(session, project_id, database_id, collection_id, endpoint):
-    """Delete all documents in the specified collection using an existing session."""
-    documents = get_collection_documents_with_session(session, project_id, database_id, collection_id, endpoint)
-    if not documents or documents.get("total", 0) == 0:
+# Documents removed per bulk-delete request when purging a collection
+PURGE_BATCH_SIZE = 1000
+
+class _ProgressMeter:
+    """Thread-safe counter that prints progress and throughput every few seconds"""
+
+    def __init__(self, label, interval=2.0):
+        self.label = label
+        self.interval = interval
+        self.count = 0
+        self.started = time.monotonic()
+        self._reported = self.started
+        self._lock = threading.Lock()
+
+    def add(self, amount=1):
+        with self._lock:
+            self.count += amount
+            now = time.monotonic()
+            if now - self._reported >= self.interval:
+                self._reported = now
+                print(f"{self.label} {self.count} documents ({self.rate():.0f} docs/s)")
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def rate(self):
+        return self.count / max(self.elapsed(), 1e-9)
+
+def _bulk_delete_documents(session, url, project_id, rate_limiter, progress, batch_size=PURGE_BATCH_SIZE):
+    """Purge through the bulk documents DELETE endpoint; returns False if the server lacks it.
+
+    A failed request part-way through raises requests.HTTPError.
+    """
+    headers = {"X-Appwrite-Project": project_id, "Content-Type": "application/json"}
+    while True:
+        # Repeating a purge step is harmless, so transient failures may be retried
+        response = _send_request(session, "DELETE", url, rate_limiter=rate_limiter, idempotent=True,
+                                 headers=headers, json={"queries": [_query("limit", values=[batch_size])]})
+        if response.status_code != 200:
+            if progress.count == 0 and _is_bulk_unsupported(response):
+                return False
+            raise requests.HTTPError(f"Bulk delete failed: {response.text}", response=response)
+        removed = response.json().get("total", 0)
+        progress.add(removed)
+        if removed < batch_size:
+            return True
+
+def delete_all_documents_with_session(session, project_id, database_id, collection_id, endpoint, concurrency=1, rate_limiter=None, use_bulk=True):
+    """Delete all documents in the specified collection using an existing session.
+
+    Where the server supports it (and use_bulk is set), documents are removed
+    PURGE_BATCH_SIZE at a time with bulk-delete queries. Otherwise the
+    collection's IDs are streamed with cursor pagination and deleted one request
+    each, from a pool of concurrency workers paced by rate_limiter. A page is only
+    deleted once the page after it has been fetched, so the cursor document still
+    exists when the next request uses it. Progress and throughput are printed as
+    the purge runs; returns the number of documents deleted, or None if the purge
+    did not finish.
+    """
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    headers = {"X-Appwrite-Project": project_id}
+    progress = _ProgressMeter("🗑️  Deleted")
+    
+    def delete_one(doc_id):
+        try:
+            response = _send_request(session, "DELETE", f"{url}/{doc_id}", rate_limiter=rate_limiter,
+                                     headers=headers)
+        except requests.RequestException as e:
+            print(f"❌ Failed to delete document {doc_id}: {str(e)}")
+            return False
+        # 404: already gone, e.g. deleted by a retried request
+        if response.status_code not in (204, 404):
+            print(f"❌ Failed to delete document {doc_id}: {response.text}")
+            return False
+        progress.add()
+        return True
+    
+    def lagged_ids():
+        """Yield each page's IDs only after the following page has been fetched"""
+        pending = []
+        pages = iter_collection_pages(session, project_id, database_id, collection_id, endpoint,
+                                      queries=[_query("select", values=["$id"])], prefetch=False)
+        for page in pages:
+            yield from pending
+            pending = [doc["$id"] for doc in page]
+        yield from pending
+    
+    failed = 0
+    try:
+        if not (use_bulk and _bulk_delete_documents(session, url, project_id, rate_limiter, progress)):
+            if use_bulk:
+                print("Server does not support bulk deletes, deleting documents one at a time")
+            with _ordered_map(session, delete_one, lagged_ids(), concurrency) as results:
+                failed = sum(not ok for ok in results)
+    except requests.RequestException as e:
+        print(f"❌ Purge of collection {collection_id} stopped after {progress.count} documents: {str(e)}")
+        return None
+    deleted = progress.count
+    
+    if failed:
+        print(f"❌ Deleted {deleted} documents from collection {collection_id}, {failed} could not be deleted")
+        return None
+    if deleted == 0:
         print("No documents found to delete.")
-        return
-    for doc in documents.get("documents", []):
-        doc_id = doc["$id"]
-        delete_document_with_session(session, project_id, database_id, collection_id, doc_id, endpoint)
+        return 0
+    print(f"Deleted {deleted} documents from collection {collection_id} "
+          f"in {progress.elapsed():.1f}s ({progress.rate():.0f} docs/s)")
+    return deleted
 
 def update_document_with_session(session, project_id, database_id, collection_id, document_id, data, endpoint):
     """Update a specific document using an existing session."""
@@ -276,71 +1326,519 @@ def update_document_with_session(session, project_id, database_id, collection_id
         print(f"❌ Failed to update document {document_id}: {response.text}")
         return None
 
-def bulk_update_documents_with_session(session, yaml_file, project_id, database_id, collection_id, endpoint):
+def _comparable(value):
+    """Normalise a field value for diffing: expanded related documents compare by $id"""
+    if isinstance(value, dict) and "$id" in value:
+        return value["$id"]
+    if isinstance(value, list):
+        return [_comparable(item) for item in value]
+    return value
+
+def diff_document_fields(current, desired):
+    """Return the fields of desired whose values differ from the current document"""
+    return {
+        field: value for field, value in desired.items()
+        if field not in current or _comparable(current[field]) != _comparable(value)
+    }
+
+def bulk_update_documents_with_session(session, yaml_file, project_id, database_id, collection_id, endpoint, yaml_cache=False, input_format=None, column_types=None, concurrency=1, rate_limiter=None, diff=True, batch_size=MAX_DOCUMENT_BATCH_SIZE):
     """Bulk update documents from YAML data using an existing session.
 
     Each entry in the YAML file should be a dictionary that includes a 'documentId' key
     for the document to update, along with other key-value pairs representing the fields to update.
+    The file is streamed with iter_input_documents, so updates start before it is fully
+    parsed; JSONL and CSV files (one document per line/row) are accepted as well.
+
+    Entries are processed batch_size at a time. With diff set, each batch's current
+    documents are fetched with one equal("$id", [...]) query and only the fields
+    that actually changed are PATCHed; entries with no changes send nothing.
+    Batches run on concurrency worker threads, paced by rate_limiter.
     """
-    data = load_yaml_data(yaml_file)
-    if not data or len(data) == 0:
-        print("No data found in YAML file for updating.")
-        return
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    headers = {
+        "X-Appwrite-Project": project_id,
+        "Content-Type": "application/json"
+    }
+    
+    def patch(document_id, data):
+        """PATCH one document and return an error message, or None on success"""
+        try:
+            # Setting fields to given values can safely be repeated
+            response = _send_request(session, "PATCH", f"{url}/{document_id}", rate_limiter=rate_limiter,
+                                     idempotent=True, headers=headers, json={"data": data})
+        except requests.RequestException as e:
+            return str(e)
+        return None if response.status_code == 200 else response.text
+    
+    def update_batch(batch):
+        """Apply a batch of (index, entry) pairs and return (index, status, detail) per entry"""
+        current = {}
+        if diff:
+            ids = {entry["documentId"] for _, entry in batch if isinstance(entry, dict) and "documentId" in entry}
+            try:
+                current = get_documents_by_ids(session, project_id, database_id, collection_id, ids, endpoint)
+            except requests.RequestException as e:
+                return [(idx, "failed", f"could not fetch current documents: {str(e)}") for idx, _ in batch]
+        outcomes = []
+        for idx, entry in batch:
+            if not isinstance(entry, dict) or "documentId" not in entry:
+                outcomes.append((idx, "invalid", None))
+                continue
+            data = dict(entry)
+            document_id = data.pop("documentId")
+            if diff:
+                if document_id not in current:
+                    outcomes.append((idx, "failed", f"document {document_id} not found"))
+                    continue
+                data = diff_document_fields(current[document_id], data)
+                if not data:
+                    outcomes.append((idx, "unchanged", document_id))
+                    continue
+            error = patch(document_id, data)
+            if error is not None:
+                outcomes.append((idx, "failed", f"document {document_id}: {error}"))
+                continue
+            if diff:
+                # Later entries for the same document diff against the updated values
+                current[document_id].update(data)
+            outcomes.append((idx, "updated", (document_id, sorted(data))))
+        return outcomes
+    
     successful = 0
+    unchanged = 0
     failed = 0
     errors = []
+    processed = 0
     print(f"Starting bulk update for documents in collection {collection_id}")
-    for idx, doc_data in enumerate(data, 1):
-        if "documentId" not in doc_data:
-            print(f"Skipping update for item {idx}: No 'documentId' provided.")
-            continue
-        document_id = doc_data.pop("documentId")
-        result = update_document_with_session(session, project_id, database_id, collection_id, document_id, doc_data, endpoint)
-        if result:
-            successful += 1
-        else:
-            failed += 1
-            errors.append(f"Error updating document {document_id}")
+    batches = _batched(enumerate(iter_input_documents(yaml_file, input_format, column_types, yaml_cache), 1),
+                       batch_size)
+    with _ordered_map(session, update_batch, batches, concurrency) as results:
+        for idx, status, detail in (outcome for batch in results for outcome in batch):
+            processed = idx
+            if status == "invalid":
+                print(f"Skipping update for item {idx}: No 'documentId' provided.")
+            elif status == "unchanged":
+                unchanged += 1
+            elif status == "updated":
+                successful += 1
+                document_id, fields = detail
+                print(f"✅ Document {document_id} updated successfully ({', '.join(fields)}).")
+            else:
+                failed += 1
+                errors.append(f"Error updating item {idx}: {detail}")
+                print(f"❌ Failed to update item {idx}: {detail}")
+    if processed == 0:
+        print("No data found in YAML file for updating.")
+        return
     print("\n--- Bulk Update Summary ---")
-    print(f"Total items processed: {len(data)}")
+    print(f"Total items processed: {processed}")
     print(f"Successfully updated: {successful}")
+    if diff:
+        print(f"Unchanged (skipped): {unchanged}")
     print(f"Failed updates: {failed}")
     if errors:
         print("Errors encountered:")
         for error in errors:
             print(f"- {error}")
 
-def _process_images_field(data, session, project_id, bucket_id, endpoint, yaml_dir):
-    """Upload image file paths in data and replace them with file IDs."""
+def _natural_key(record, key_fields):
+    """Tuple of a record's natural-key values, or None if any are missing"""
+    values = tuple(_comparable(record.get(field)) for field in key_fields)
+    if any(value is None for value in values):
+        return None
+    # Lists are unhashable; compare them by their JSON form
+    return tuple(json.dumps(value, sort_keys=True, default=str) if isinstance(value, (list, dict)) else value
+                 for value in values)
+
+def sync_collection_with_session(session, yaml_file, project_id, database_id, collection_id, endpoint, key_fields, delete_missing=True, concurrency=1, rate_limiter=None, dry_run=False, yaml_cache=False, input_format=None, column_types=None):
+    """Reconcile a collection with a dataset, matching records on a natural key.
+
+    The dataset (YAML, JSONL or CSV) is loaded into a key -> entry map and the
+    collection is streamed once with cursor pagination. Documents whose key is in
+    the dataset get the fields that differ PATCHed; dataset entries with no
+    matching document are created; documents whose key is not in the dataset
+    (and extra documents sharing a key) are deleted when delete_missing is set.
+    The resulting operations run on concurrency worker threads, paced by
+    rate_limiter. With dry_run the plan is printed but nothing is changed.
+
+    Returns a dict of counts per outcome, or None if the collection could not be
+    read in full; nothing is changed then, since every unseen document would
+    otherwise be planned as a create.
+    """
+    key_fields = [key_fields] if isinstance(key_fields, str) else list(key_fields)
+    
+    desired = {}
+    invalid = 0
+    for idx, entry in enumerate(iter_input_documents(yaml_file, input_format, column_types, yaml_cache), 1):
+        key = _natural_key(entry, key_fields) if isinstance(entry, dict) else None
+        if key is None:
+            invalid += 1
+            print(f"Skipping item {idx}: missing key field(s) {', '.join(key_fields)}")
+            continue
+        if key in desired:
+            print(f"⚠️ Item {idx} repeats key {key}; the later entry wins")
+        desired[key] = entry
+    
+    updates = []
+    deletes = []
+    matched = set()
+    unchanged = 0
+    print(f"Comparing {len(desired)} records with collection {collection_id}...")
+    try:
+        for doc in iter_collection_documents(session, project_id, database_id, collection_id, endpoint):
+            key = _natural_key(doc, key_fields)
+            if key in desired and key not in matched:
+                matched.add(key)
+                changes = diff_document_fields(doc, desired[key])
+                if changes:
+                    updates.append((doc["$id"], changes))
+                else:
+                    unchanged += 1
+            elif delete_missing:
+                deletes.append(doc["$id"])
+    except requests.RequestException as e:
+        print(f"❌ Could not read collection {collection_id}, sync aborted without changes: {str(e)}")
+        return None
+    creates = [entry for key, entry in desired.items() if key not in matched]
+    
+    print(f"Plan: {len(creates)} to create, {len(updates)} to update, "
+          f"{len(deletes)} to delete, {unchanged} unchanged")
+    counts = {"created": 0, "updated": 0, "deleted": 0, "unchanged": unchanged, "failed": 0, "invalid": invalid}
+    if dry_run:
+        return counts
+    
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    headers = {
+        "X-Appwrite-Project": project_id,
+        "Content-Type": "application/json"
+    }
+    
+    def apply(operation):
+        """Run one (kind, document ID, data) operation and return (kind, error)"""
+        kind, document_id, data = operation
+        try:
+            # Creates use a client-side ID so that every operation is safe to retry; a
+            # 409 is an earlier attempt only if that ID exists, not a unique-index conflict
+            if kind == "created":
+                response = _send_request(session, "POST", url, rate_limiter=rate_limiter, idempotent=True,
+                                         headers=headers, json={"documentId": document_id, "data": data})
+                ok = response.status_code == 201 or (
+                    response.status_code == 409
+                    and _stored_document(session, url, headers, document_id, rate_limiter) is not None
+                )
+            elif kind == "updated":
+                response = _send_request(session, "PATCH", f"{url}/{document_id}", rate_limiter=rate_limiter,
+                                         idempotent=True, headers=headers, json={"data": data})
+                ok = response.status_code == 200
+            else:
+                response = _send_request(session, "DELETE", f"{url}/{document_id}", rate_limiter=rate_limiter,
+                                         headers=headers)
+                ok = response.status_code in (204, 404)
+        except requests.RequestException as e:
+            return kind, f"{document_id}: {str(e)}"
+        return kind, None if ok else f"{document_id}: {response.text}"
+    
+    operations = itertools.chain(
+        (("created", new_id(), entry) for entry in creates),
+        (("updated", document_id, changes) for document_id, changes in updates),
+        (("deleted", document_id, None) for document_id in deletes),
+    )
+    with _ordered_map(session, apply, operations, concurrency) as results:
+        for kind, error in results:
+            if error is None:
+                counts[kind] += 1
+            else:
+                counts["failed"] += 1
+                print(f"❌ Failed to sync ({kind[:-1]}) document {error}")
+    
+    print("\n--- Sync Summary ---")
+    print(f"Created: {counts['created']}")
+    print(f"Updated: {counts['updated']}")
+    print(f"Deleted: {counts['deleted']}")
+    print(f"Unchanged: {counts['unchanged']}")
+    print(f"Failed: {counts['failed']}")
+    return counts
+
+EXPORT_FORMATS = ("jsonl", "parquet", "arrow")
+# System fields kept in columnar exports alongside the collection's attributes
+EXPORT_SYSTEM_FIELDS = ("$id", "$createdAt", "$updatedAt")
+_ID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def detect_export_format(output_path):
+    """Guess the export format from the file extension (JSONL unless .parquet/.arrow/.feather)"""
+    suffix = Path(output_path).suffix.lower()
+    if suffix == ".parquet":
+        return "parquet"
+    if suffix in (".arrow", ".feather"):
+        return "arrow"
+    return "jsonl"
+
+def _edge_document_id(session, project_id, database_id, collection_id, endpoint, order):
+    """Smallest (orderAsc) or largest (orderDesc) document ID in a collection, or None if empty"""
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    queries = [_query(order, "$id"), _query("limit", values=[1]), _query("select", values=["$id"])]
+    response = _send_request(session, "GET", url, headers={"X-Appwrite-Project": project_id},
+                             params={"queries[]": queries})
+    response.raise_for_status()
+    documents = response.json().get("documents", [])
+    return documents[0]["$id"] if documents else None
+
+def _id_to_number(document_id, width):
+    """Read the first width characters of an ID as a base-36 number (others clamp to the alphabet)"""
+    number = 0
+    for char in document_id.lower()[:width].ljust(width, "0"):
+        digit = _ID_ALPHABET.find(char)
+        if digit < 0:
+            digit = 0 if char < "0" else len(_ID_ALPHABET) - 1
+        number = number * len(_ID_ALPHABET) + digit
+    return number
+
+def _number_to_id(number, width):
+    chars = []
+    for _ in range(width):
+        number, digit = divmod(number, len(_ID_ALPHABET))
+        chars.append(_ID_ALPHABET[digit])
+    return "".join(reversed(chars))
+
+def split_id_ranges(session, project_id, database_id, collection_id, endpoint, partitions):
+    """Split a collection into up to partitions half-open ($id from, $id to) ranges.
+
+    Boundaries are spaced evenly between the smallest and largest document ID,
+    which suits Appwrite's time-ordered unique() IDs. The first and last ranges
+    are open-ended (None), so every document falls in exactly one range however
+    uneven the IDs are.
+    """
+    if partitions <= 1:
+        return [(None, None)]
+    low = _edge_document_id(session, project_id, database_id, collection_id, endpoint, "orderAsc")
+    high = _edge_document_id(session, project_id, database_id, collection_id, endpoint, "orderDesc")
+    if low is None or low == high:
+        return [(None, None)]
+    width = max(len(low), len(high))
+    start, end = _id_to_number(low, width), _id_to_number(high, width)
+    boundaries = sorted({_number_to_id(start + (end - start) * i // partitions, width)
+                         for i in range(1, partitions)})
+    edges = [None] + boundaries + [None]
+    return list(zip(edges, edges[1:]))
+
+_ARROW_TYPES = {
+    "integer": "int64",
+    "double": "float64",
+    "boolean": "bool_",
+}
+
+def _export_schema(session, project_id, database_id, collection_id, endpoint, attributes=None):
+    """Arrow schema for a collection export, built from the collection's attribute definitions.
+
+    Attributes the collection does not describe (or relationships) are exported as
+    strings, with non-string values JSON-encoded. Returns None when the collection
+    lists no attributes, in which case the columns are taken from the first rows.
+    """
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}"
+    response = _send_request(session, "GET", url, headers={"X-Appwrite-Project": project_id})
+    response.raise_for_status()
+    definitions = {attribute["key"]: attribute for attribute in response.json().get("attributes", [])}
+    if not definitions and not attributes:
+        return None
+    fields = []
+    for name in list(EXPORT_SYSTEM_FIELDS) + [key for key in (attributes or definitions) if key not in EXPORT_SYSTEM_FIELDS]:
+        definition = definitions.get(name, {})
+        arrow_type = getattr(pyarrow, _ARROW_TYPES.get(definition.get("type"), "string"))()
+        if definition.get("array"):
+            arrow_type = pyarrow.list_(arrow_type)
+        fields.append(pyarrow.field(name, arrow_type))
+    return pyarrow.schema(fields)
+
+def _arrow_value(value, arrow_type):
+    """Convert a document value to fit an Arrow column"""
+    if value is None:
+        return None
+    if pyarrow.types.is_string(arrow_type) and not isinstance(value, str):
+        # Related documents are stored by ID
+        value = _comparable(value)
+        return value if isinstance(value, str) else json.dumps(value, default=str)
+    return value
+
+class _ExportWriter:
+    """Thread-safe incremental writer for JSONL, Parquet or Arrow IPC exports.
+
+    For the columnar formats each write() call becomes one row group (or record
+    batch); callers pass at most row_group_size rows, so memory stays bounded.
+    """
+
+    def __init__(self, output_path, output_format, schema=None):
+        self.output_path = Path(output_path)
+        self.output_format = output_format
+        self.schema = schema
+        self._writer = None
+        self._file = None
+        self._warned = False
+        self._lock = threading.Lock()
+        if output_format == "jsonl":
+            self._file = open(self.output_path, 'w', encoding='utf-8')
+
+    def write(self, rows):
+        if not rows:
+            return
+        if self.output_format == "jsonl":
+            payload = "".join(json.dumps(row, default=str) + "\n" for row in rows)
+            with self._lock:
+                self._file.write(payload)
+            return
+        with self._lock:
+            if self.schema is None:
+                # No attribute definitions: type every column seen in the first rows as a string
+                names = list(EXPORT_SYSTEM_FIELDS) + sorted({key for row in rows for key in row} - set(EXPORT_SYSTEM_FIELDS))
+                self.schema = pyarrow.schema([pyarrow.field(name, pyarrow.string()) for name in names])
+            schema = self.schema
+        if not self._warned and any(key not in schema.names for row in rows for key in row if not key.startswith("$")):
+            self._warned = True
+            print("⚠️ Some documents have fields outside the export schema; those fields are left out")
+        columns = {
+            field.name: [_arrow_value(row.get(field.name), field.type) for row in rows]
+            for field in schema
+        }
+        table = pyarrow.Table.from_pydict(columns, schema=schema)
+        with self._lock:
+            if self._writer is None:
+                if self.output_format == "parquet":
+                    self._writer = pyarrow.parquet.ParquetWriter(str(self.output_path), schema)
+                else:
+                    self._writer = pyarrow.ipc.new_file(str(self.output_path), schema)
+            self._writer.write_table(table)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        if self._writer is not None:
+            self._writer.close()
+
+def export_collection(session, project_id, database_id, collection_id, endpoint, output_path, output_format=None, attributes=None, partitions=1, page_size=100, row_group_size=10000):
+    """Stream every document of a collection into a JSONL, Parquet or Arrow IPC file.
+
+    Documents are read with cursor pagination and written as they arrive, so
+    memory is bounded by row_group_size rows per partition whatever the
+    collection's size. attributes limits the export to those fields with a
+    select query. With partitions > 1 the collection is split into $id ranges
+    (see split_id_ranges) that are read in parallel; rows are then not in
+    collection order. Parquet and Arrow output need pyarrow.
+
+    Returns the number of documents exported, or None if the export failed part-way.
+    """
+    output_format = output_format or detect_export_format(output_path)
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {output_format}")
+    if output_format != "jsonl" and pyarrow is None:
+        print("❌ Parquet and Arrow exports require pyarrow: pip install pyarrow")
+        return None
+    
+    queries = []
+    if attributes:
+        # $id is always selected: cursor pagination continues from the last document's ID
+        queries.append(_query("select", values=list(dict.fromkeys(["$id", *attributes]))))
+    schema = None
+    try:
+        if output_format != "jsonl":
+            schema = _export_schema(session, project_id, database_id, collection_id, endpoint, attributes)
+        ranges = split_id_ranges(session, project_id, database_id, collection_id, endpoint, partitions)
+    except requests.RequestException as e:
+        print(f"❌ Could not prepare the export of collection {collection_id}: {str(e)}")
+        return None
+    
+    writer = _ExportWriter(output_path, output_format, schema)
+    progress = _ProgressMeter("📤 Exported")
+    flush_size = row_group_size if output_format != "jsonl" else page_size
+    
+    def export_range(id_range):
+        low, high = id_range
+        range_queries = list(queries)
+        if low is not None:
+            range_queries.append(_query("greaterThanEqual", "$id", [low]))
+        if high is not None:
+            range_queries.append(_query("lessThan", "$id", [high]))
+        buffered = []
+        for page in iter_collection_pages(session, project_id, database_id, collection_id, endpoint,
+                                          page_size=page_size, queries=range_queries):
+            buffered.extend(page)
+            progress.add(len(page))
+            if len(buffered) >= flush_size:
+                writer.write(buffered)
+                buffered = []
+        writer.write(buffered)
+    
+    print(f"Exporting collection {collection_id} to {output_path} ({output_format}, {len(ranges)} partition(s))")
+    try:
+        if len(ranges) > 1:
+            configure_connection_pool(session, len(ranges) * 2)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                for future in [executor.submit(export_range, id_range) for id_range in ranges]:
+                    future.result()
+        else:
+            export_range(ranges[0])
+    except requests.RequestException as e:
+        print(f"❌ Export stopped after {progress.count} documents, {output_path} is incomplete: {str(e)}")
+        return None
+    finally:
+        writer.close()
+    
+    print(f"✅ Exported {progress.count} documents in {progress.elapsed():.1f}s ({progress.rate():.0f} docs/s)")
+    return progress.count
+
+def _resolve_image_path(img, yaml_dir):
+    """Resolve an images entry relative to the YAML file's directory"""
+    img_path = Path(str(img))
+    if not img_path.is_absolute():
+        img_path = Path(yaml_dir) / img_path
+    return img_path
+
+def _upload_image(session, project_id, bucket_id, img_path, endpoint, existing_files=None, file_index=None):
+    """Upload one image, or find the bucket file of the same name, and return its file ID or None"""
+    result = upload_file_to_bucket_with_duplicate_check(
+        session,
+        project_id,
+        bucket_id,
+        img_path,
+        endpoint,
+        existing_files=existing_files,
+        file_index=file_index
+    )
+    if result and not result.get('skipped'):
+        return result['$id']
+    elif result and result.get('skipped'):
+        existing = result if '$id' in result else find_file_by_name_paginated(session, project_id, bucket_id, img_path.name, endpoint)
+        if existing:
+            return existing['$id']
+    return None
+
+def _process_images_field(data, session, project_id, bucket_id, endpoint, yaml_dir, existing_files=None, file_index=None, image_ids=None):
+    """Upload image file paths in data and replace them with file IDs.
+
+    existing_files is the bucket's name -> file record map, shared across the run so
+    images that are already uploaded resolve to their IDs without a bucket search.
+    image_ids maps file names already uploaded for this run to their file IDs (None
+    for a failed upload); those images are not uploaded again.
+    """
     if not bucket_id or 'images' not in data or not isinstance(data['images'], list):
         return
 
     processed_images = []
     for img in data['images']:
-        img_path = Path(str(img))
-        if not img_path.is_absolute():
-            img_path = Path(yaml_dir) / img_path
+        img_path = _resolve_image_path(img, yaml_dir)
 
         if img_path.exists():
-            result = upload_file_to_bucket_with_duplicate_check(
-                session,
-                project_id,
-                bucket_id,
-                img_path,
-                endpoint
-            )
-            if result and not result.get('skipped'):
-                processed_images.append(result['$id'])
-            elif result and result.get('skipped'):
-                existing = find_file_by_name_paginated(session, project_id, bucket_id, img_path.name, endpoint)
-                if existing:
-                    processed_images.append(existing['$id'])
+            if image_ids is not None and img_path.name in image_ids:
+                file_id = image_ids[img_path.name]
+            else:
+                file_id = _upload_image(session, project_id, bucket_id, img_path, endpoint,
+                                        existing_files=existing_files, file_index=file_index)
+            if file_id:
+                processed_images.append(file_id)
         else:
             processed_images.append(str(img))
 
     data['images'] = processed_images
 
-def create_documents_with_relationships(session, yaml_file, project_id, database_id, collection_mapping, endpoint, bucket_id=None):
+def create_documents_with_relationships(session, yaml_file, project_id, database_id, collection_mapping, endpoint, bucket_id=None, file_index=None, concurrency=1, verify=True, yaml_cache=False):
     """
     Process a YAML file with a Children/Parent structure.
 
@@ -354,21 +1852,27 @@ def create_documents_with_relationships(session, yaml_file, project_id, database
              - collection_name: the name of the parent collection (e.g., "nezuko")
              - data: a dictionary containing relationship fields that reference one of the child definitions via YAML anchors.
 
+    The entries form a dependency graph: every child can be created at once, and
+    each parent is dispatched as soon as the children its anchors reference have
+    been created. With concurrency > 1 this runs on a thread pool. When verify is
+    set, the created parents are read back afterwards with batched queries.
+
     If `bucket_id` is provided and a parent `data` dictionary contains an `images`
     field with file paths, those images will be uploaded to the specified bucket
     and replaced with their resulting file IDs before the parent document is
-    created.
+    created. The bucket is listed once per run; images already in it are reused
+    by ID rather than uploaded again.
+
+    With yaml_cache=True the parsed file is cached (see load_yaml_data).
     """
-    yaml_data = load_yaml_data(yaml_file)
+    yaml_data = load_yaml_data(yaml_file, cache=yaml_cache)
     if not ("Children" in yaml_data and "Parent" in yaml_data):
         print("YAML file does not contain both 'Children' and 'Parent' sections.")
         return
     
-    child_mapping = {}
-    print("--- Processing Children ---")
+    children = []
     for child in yaml_data["Children"]:
         coll_name = child.get("collection_name")
-        print(f"Processing child collection: {coll_name}")
         data = child.get("data")
         if not coll_name or not data:
             print("Child entry is missing 'collection_name' or 'data'. Skipping.")
@@ -376,20 +1880,64 @@ def create_documents_with_relationships(session, yaml_file, project_id, database
         if coll_name not in collection_mapping:
             print(f"Collection name '{coll_name}' not found in collection mapping. Skipping child.")
             continue
-        coll_id = collection_mapping[coll_name]
-        result = create_document_with_session(session, project_id, database_id, coll_id, data, endpoint)
-        if result is not None:
-            # Store the mapping from the data object's id (from YAML) to the document ID returned by Appwrite
-            child_mapping[id(data)] = result["$id"]
+        children.append((coll_name, data))
+    child_keys = {id(data) for _, data in children}
     
-    print("--- Processing Parent ---")
+    parents = []
     for parent in yaml_data["Parent"]:
-        print(f"Processing parent collection: {parent.get('collection_name')}")
         coll_name = parent.get("collection_name")
         data = parent.get("data")
         if not coll_name or not data:
             print("Parent entry is missing 'collection_name' or 'data'. Skipping.")
             continue
+        if coll_name not in collection_mapping:
+            print(f"Collection name '{coll_name}' not found in collection mapping for parent. Skipping.")
+            continue
+        # The parent waits for every child its relationship fields point at
+        dependencies = {
+            id(value['value']) for value in data.values()
+            if isinstance(value, dict) and 'value' in value and 'relation' in value
+        } & child_keys
+        parents.append((coll_name, data, dependencies))
+    
+    existing_files = None
+    image_ids = None
+    if bucket_id:
+        try:
+            existing_files = get_bucket_file_map(session, project_id, bucket_id, endpoint, file_index=file_index)
+        except requests.RequestException as e:
+            print(f"❌ Could not list bucket {bucket_id}: {str(e)}")
+            return
+        # Parents run concurrently, so each distinct image is uploaded once up front
+        # instead of by every parent that references it
+        images = {}
+        for _, data, _ in parents:
+            if not isinstance(data.get('images'), list):
+                continue
+            for img in data['images']:
+                img_path = _resolve_image_path(img, Path(yaml_file).parent)
+                if img_path.exists():
+                    images.setdefault(img_path.name, img_path)
+        
+        def upload_image(img_path):
+            return img_path.name, _upload_image(session, project_id, bucket_id, img_path, endpoint,
+                                                existing_files=existing_files, file_index=file_index)
+        
+        with _ordered_map(session, upload_image, images.values(), concurrency) as results:
+            image_ids = dict(results)
+    
+    child_mapping = {}
+    
+    def create_child(coll_name, data):
+        print(f"Processing child collection: {coll_name}")
+        coll_id = collection_mapping[coll_name]
+        result = create_document_with_session(session, project_id, database_id, coll_id, data, endpoint)
+        if result is not None:
+            # Store the mapping from the data object's id (from YAML) to the document ID returned by Appwrite
+            child_mapping[id(data)] = result["$id"]
+    
+    def create_parent(coll_name, data):
+        print(f"Processing parent collection: {coll_name}")
         # Process each field in parent's data
         for key, value in data.items():
             if isinstance(value, dict) and 'value' in value and 'relation' in value:
@@ -408,15 +1956,66 @@ def create_documents_with_relationships(session, yaml_file, project_id, database
                     print(f"Could not find a matching child for field '{key}'.")
 
         # Handle image uploads if needed
-        _process_images_field(data, session, project_id, bucket_id, endpoint, Path(yaml_file).parent)
-        if coll_name not in collection_mapping:
-            print(f"Collection name '{coll_name}' not found in collection mapping for parent. Skipping.")
-            continue
+        _process_images_field(data, session, project_id, bucket_id, endpoint, Path(yaml_file).parent,
+                              existing_files=existing_files, file_index=file_index, image_ids=image_ids)
         parent_coll_id = collection_mapping[coll_name]
         parent_result = create_document_with_session(session, project_id, database_id, parent_coll_id, data, endpoint)
         if parent_result:
-                # Verify by retrieving the document back using its document ID
-                get_document_with_session(session, project_id, database_id, parent_coll_id, parent_result['$id'], endpoint)
+            return parent_coll_id, parent_result['$id']
+        return None
+    
+    print(f"--- Processing {len(children)} children and {len(parents)} parents ---")
+    if concurrency > 1:
+        configure_connection_pool(session, concurrency)
+    
+    created_parents = []
+    waiting = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        running = {}
+        for coll_name, data in children:
+            running[executor.submit(create_child, coll_name, data)] = id(data)
+        for coll_name, data, dependencies in parents:
+            if dependencies:
+                waiting.append((set(dependencies), coll_name, data))
+            else:
+                running[executor.submit(create_parent, coll_name, data)] = None
+        
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                child_key = running.pop(future)
+                result = future.result()
+                if child_key is None:
+                    if result:
+                        created_parents.append(result)
+                    continue
+                # A child finished (created or not): release parents that were waiting on it
+                still_waiting = []
+                for dependencies, coll_name, data in waiting:
+                    dependencies.discard(child_key)
+                    if dependencies:
+                        still_waiting.append((dependencies, coll_name, data))
+                    else:
+                        running[executor.submit(create_parent, coll_name, data)] = None
+                waiting = still_waiting
+    
+    if verify and created_parents:
+        # Verify by reading the parents back, one batched query per collection
+        by_collection = {}
+        for parent_coll_id, doc_id in created_parents:
+            by_collection.setdefault(parent_coll_id, []).append(doc_id)
+        for parent_coll_id, doc_ids in by_collection.items():
+            try:
+                found = get_documents_by_ids(session, project_id, database_id, parent_coll_id, doc_ids, endpoint)
+            except requests.RequestException as e:
+                print(f"❌ Failed to read back documents from collection {parent_coll_id}: {str(e)}")
+                continue
+            for doc_id in doc_ids:
+                if doc_id in found:
+                    print("✅ Document retrieved successfully:")
+                    print(found[doc_id])
+                else:
+                    print(f"❌ Failed to get document (ID: {doc_id})")
     print("--- Relationship documents creation complete ---")
 
 # --- Storage/Media Upload Functions ---
@@ -452,99 +2051,173 @@ def get_supported_media_extensions():
     """Get list of all supported media file extensions (images + videos)"""
     return get_supported_image_extensions() + get_supported_video_extensions()
 
-def get_bucket_file_names(session, project_id, bucket_id, endpoint):
-    """Get a set of all file names in the bucket for duplicate checking with full pagination support"""
-    
+def iter_bucket_file_pages(session, project_id, bucket_id, endpoint, page_size=100, queries=None, prefetch=True):
+    """Yield every page of files in a bucket using cursor pagination on $id.
+
+    Unlike offset paging, each request costs the same however deep the scan is,
+    and files added or removed mid-scan do not shift later pages.
+    """
     url = f"{endpoint}/storage/buckets/{bucket_id}/files"
-    headers = {
-        "X-Appwrite-Project": project_id
-    }
+    return _iter_cursor_pages(session, url, project_id, "files",
+                              page_size=page_size, queries=queries, prefetch=prefetch)
+
+def iter_bucket_files(session, project_id, bucket_id, endpoint, page_size=100, queries=None, prefetch=True):
+    """Yield every file in a bucket one at a time using cursor pagination"""
+    for page in iter_bucket_file_pages(session, project_id, bucket_id, endpoint,
+                                       page_size=page_size, queries=queries, prefetch=prefetch):
+        yield from page
+
+DEFAULT_FILE_INDEX_PATH = CACHE_DIR / "file-index.sqlite3"
+
+class BucketFileIndex:
+    """Local SQLite index of a bucket's files (name -> file ID, size, $updatedAt, signature).
+
+    refresh() only asks Appwrite for files whose $updatedAt is at or after the last
+    one already indexed, so repeated runs against a large bucket skip the full
+    listing. Files deleted by other clients are not seen by an incremental refresh;
+    pass full=True to rebuild the index from scratch.
+    """
+
+    def __init__(self, endpoint, project_id, bucket_id, path=None):
+        self.path = Path(path or DEFAULT_FILE_INDEX_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.bucket_id = bucket_id
+        # One index file can hold buckets from several projects/servers
+        self.scope = f"{endpoint}#{project_id}#{bucket_id}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "scope TEXT NOT NULL, file_id TEXT NOT NULL, name TEXT NOT NULL, "
+                "size INTEGER, updated_at TEXT, signature TEXT, PRIMARY KEY (scope, file_id))"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(files)")}
+            if "signature" not in columns:
+                # Index files written before content hashes were tracked
+                self._conn.execute("ALTER TABLE files ADD COLUMN signature TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS files_by_name ON files (scope, name)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks (scope TEXT PRIMARY KEY, updated_at TEXT)"
+            )
+
+    def refresh(self, session, project_id, endpoint, full=False):
+        """Pull files changed since the last refresh (or every file when full=True)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at FROM watermarks WHERE scope = ?", (self.scope,)
+            ).fetchone()
+        watermark = None if full or not row else row[0]
+        if full:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM files WHERE scope = ?", (self.scope,))
+
+        queries = [_query("orderAsc", "$updatedAt")]
+        if watermark:
+            queries.append(_query("greaterThanEqual", "$updatedAt", [watermark]))
+
+        changed = 0
+        for files in iter_bucket_file_pages(session, project_id, self.bucket_id, endpoint, queries=queries):
+            for file in files:
+                self.add(file)
+            changed += len(files)
+            watermark = max(watermark or "", files[-1].get('$updatedAt', ""))
+        if watermark:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO watermarks (scope, updated_at) VALUES (?, ?)",
+                    (self.scope, watermark)
+                )
+        print(f"🗂️  File index refreshed: {changed} new or changed files, {len(self)} files indexed")
+        return changed
+
+    def add(self, file):
+        """Record a file returned by the Appwrite API"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (scope, file_id, name, size, updated_at, signature) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.scope, file['$id'], file['name'], file.get('sizeOriginal'), file.get('$updatedAt'),
+                 file.get('signature'))
+            )
+
+    def remove_name(self, name):
+        """Forget every indexed file with the given name"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files WHERE scope = ? AND name = ?", (self.scope, name))
+
+    def names(self):
+        """Return the set of indexed file names"""
+        return set(self.records())
+
+    def records(self):
+        """Return a map of file name -> file record for every indexed file"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT file_id, name, size, updated_at, signature FROM files WHERE scope = ?", (self.scope,)
+            ).fetchall()
+        return {
+            name: {'$id': file_id, 'name': name, 'sizeOriginal': size, '$updatedAt': updated_at,
+                   'signature': signature}
+            for file_id, name, size, updated_at, signature in rows
+        }
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM files WHERE scope = ?", (self.scope,)
+            ).fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+def get_bucket_file_map(session, project_id, bucket_id, endpoint, file_index=None):
+    """Get a map of file name -> file record for every file in the bucket.
+
+    Built once per run, it answers duplicate checks and name -> ID lookups without
+    further list requests. With a BucketFileIndex, only files changed since its
+    last refresh are listed.
+    """
     
-    all_files = []
-    limit = 100  # Maximum allowed by Appwrite
+    if file_index is not None:
+        file_index.refresh(session, project_id, endpoint)
+        return file_index.records()
+    
+    file_map = {}
+    scanned = 0
+    page = 0
     
     print("Scanning bucket for existing files...")
-    page = 1
     
-    while True:
-        # Build parameters for current page - use simple limit/offset
-        params = {
-            'limit': limit,
-            'offset': (page - 1) * limit
-        }
-        
-        response = session.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"❌ Failed to list files on page {page}: {response.text}")
-            # Return what we have so far rather than failing completely
-            break
-        
-        files_data = response.json()
-        # Try both 'documents' and 'files' keys for compatibility
-        files = files_data.get('files', files_data.get('documents', []))
-        total = files_data.get('total', len(all_files))
-        
-        if not files:
-            break
-        
-        all_files.extend(files)
-        print(f"📄 Scanned page {page}: {len(files)} files (Total so far: {len(all_files)}/{total})")
-        
-        # If we got less than the limit, we've reached the end
-        if len(files) < limit:
-            break
-            
-        page += 1
+    for page, files in enumerate(iter_bucket_file_pages(session, project_id, bucket_id, endpoint), 1):
+        scanned += len(files)
+        file_map.update((file['name'], file) for file in files)
+        print(f"📄 Scanned page {page}: {len(files)} files (Total so far: {scanned})")
     
-    # Return set of file names for fast lookup
-    file_names = {file['name'] for file in all_files}
-    print(f"✅ Complete scan finished: Found {len(file_names)} existing files across {page} pages")
-    return file_names
+    print(f"✅ Complete scan finished: Found {len(file_map)} existing files across {page} pages")
+    return file_map
+
+def get_bucket_file_names(session, project_id, bucket_id, endpoint, file_index=None):
+    """Get a set of all file names in the bucket for duplicate checking with full pagination support"""
+    return set(get_bucket_file_map(session, project_id, bucket_id, endpoint, file_index=file_index))
 
 def get_all_bucket_files_detailed(session, project_id, bucket_id, endpoint):
-    """Get detailed information about all files in the bucket with full pagination support"""
-    
-    url = f"{endpoint}/storage/buckets/{bucket_id}/files"
-    headers = {
-        "X-Appwrite-Project": project_id
-    }
+    """Get detailed information about all files in the bucket with full pagination support.
+
+    Returns None if a page could not be retrieved.
+    """
     
     all_files = []
-    limit = 100  # Maximum allowed by Appwrite
+    page = 0
     
     print("Retrieving detailed file information...")
-    page = 1
     
-    while True:
-        # Build parameters for current page - use simple limit/offset
-        params = {
-            'limit': limit,
-            'offset': (page - 1) * limit
-        }
-        
-        response = session.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"❌ Failed to retrieve files on page {page}: {response.text}")
-            break
-        
-        files_data = response.json()
-        # Try both 'documents' and 'files' keys for compatibility
-        files = files_data.get('files', files_data.get('documents', []))
-        total = files_data.get('total', len(all_files))
-        
-        if not files:
-            break
-        
-        all_files.extend(files)
-        print(f"📄 Retrieved page {page}: {len(files)} files (Total: {len(all_files)}/{total})")
-        
-        # If we got less than the limit, we've reached the end
-        if len(files) < limit:
-            break
-            
-        page += 1
+    try:
+        for page, files in enumerate(iter_bucket_file_pages(session, project_id, bucket_id, endpoint), 1):
+            all_files.extend(files)
+            print(f"📄 Retrieved page {page}: {len(files)} files (Total: {len(all_files)})")
+    except requests.RequestException as e:
+        print(f"❌ Failed to retrieve files on page {page + 1}: {str(e)}")
+        return None
     
     print(f"✅ Retrieved {len(all_files)} files total across {page} pages")
     return all_files
@@ -575,77 +2248,280 @@ def find_file_by_name_paginated(session, project_id, bucket_id, file_name, endpo
             if file['name'] == file_name:
                 return file
     
-    # If search didn't work or didn't find exact match, fall back to full pagination
+    # If search didn't work or didn't find exact match, fall back to a full scan
     print(f"🔍 Searching for '{file_name}' across all pages...")
     
-    all_files = []
-    limit = 100
-    page = 1
-    
-    while True:
-        # Build parameters for current page - use simple limit/offset
-        params = {
-            'limit': limit,
-            'offset': (page - 1) * limit
-        }
-        
-        response = session.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"❌ Failed to search on page {page}: {response.text}")
-            break
-        
-        files_data = response.json()
-        # Try both 'documents' and 'files' keys for compatibility
-        files = files_data.get('files', files_data.get('documents', []))
-        
-        if not files:
-            break
-        
+    page = 0
+    for page, files in enumerate(iter_bucket_file_pages(session, project_id, bucket_id, endpoint), 1):
         # Check each file on this page
         for file in files:
             if file['name'] == file_name:
                 print(f"✅ Found '{file_name}' on page {page}")
                 return file
-        
-        all_files.extend(files)
-        
-        # If we got less than the limit, we've reached the end
-        if len(files) < limit:
-            break
+    
+    print(f"❌ File '{file_name}' not found after searching {page} pages")
+    return None
+
+def delete_file_by_id(session, project_id, bucket_id, file_id, endpoint, file_name=None):
+    """Delete a file from bucket by its ID"""
+    
+    delete_url = f"{endpoint}/storage/buckets/{bucket_id}/files/{file_id}"
+    headers = {
+        "X-Appwrite-Project": project_id
+    }
+    
+    delete_response = _send_request(session, "DELETE", delete_url, headers=headers)
+    
+    if delete_response.status_code == 204:
+        print(f"🗑️  Deleted existing file: {file_name or file_id} (ID: {file_id})")
+        return True
+    else:
+        print(f"❌ Failed to delete file {file_name or file_id}: {delete_response.text}")
+        return False
+
+def delete_file_by_name_paginated(session, project_id, bucket_id, file_name, endpoint):
+    """Delete a file from bucket by its name using paginated search"""
+    
+    # Find the file first
+    target_file = find_file_by_name_paginated(session, project_id, bucket_id, file_name, endpoint)
+    
+    if not target_file:
+        print(f"❌ File not found for deletion: {file_name}")
+        return False
+    
+    # Delete the file using its ID
+    return delete_file_by_id(session, project_id, bucket_id, target_file['$id'], endpoint, file_name=file_name)
+
+# Appwrite stores uploads larger than this in chunks (APP_STORAGE_CHUNK_SIZE)
+UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024
+UPLOAD_STATE_PATH = CACHE_DIR / "uploads.json"
+_upload_state_lock = threading.Lock()
+
+def _upload_state_key(bucket_id, file_path):
+    """Identify an upload by bucket and the file's path, size and modification time"""
+    stat = file_path.stat()
+    return f"{bucket_id}:{file_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def _update_upload_state(key, file_id=None):
+    """Record (or with file_id=None forget) the Appwrite file ID of an upload in progress"""
+    with _upload_state_lock:
+        try:
+            state = json.loads(UPLOAD_STATE_PATH.read_text())
+        except (OSError, ValueError):
+            state = {}
+        if file_id is None:
+            if state.pop(key, None) is None:
+                return
+        else:
+            state[key] = file_id
+        UPLOAD_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        UPLOAD_STATE_PATH.write_text(json.dumps(state))
+
+def _get_upload_state(key):
+    """Return the Appwrite file ID of an interrupted upload, if one was recorded"""
+    with _upload_state_lock:
+        try:
+            return json.loads(UPLOAD_STATE_PATH.read_text()).get(key)
+        except (OSError, ValueError):
+            return None
+
+def _get_uploaded_chunks(session, project_id, bucket_id, file_id, endpoint):
+    """Return (chunksUploaded, file record) for a partial upload, or (None, None) if unknown"""
+    url = f"{endpoint}/storage/buckets/{bucket_id}/files/{file_id}"
+    headers = {"X-Appwrite-Project": project_id}
+    try:
+        response = _send_request(session, "GET", url, headers=headers)
+    except requests.RequestException:
+        return None, None
+    if response.status_code != 200:
+        return None, None
+    record = response.json()
+    return record.get('chunksUploaded', 0), record
+
+def _is_unfinished_upload(record):
+    """True for a bucket file record whose chunked upload never completed"""
+    return bool(record) and record.get('chunksUploaded', 0) < record.get('chunksTotal', 0)
+
+def upload_file_chunked(session, project_id, bucket_id, file_path, endpoint, file_id=None, permissions=None, mime_type=None, chunk_size=UPLOAD_CHUNK_SIZE, rate_limiter=None, max_resume_attempts=3):
+    """Upload a file in Content-Range chunks, resuming from the last acknowledged chunk.
+
+    Chunks are read from disk one at a time. The Appwrite file ID is recorded in a
+    local state file after the first chunk, so a later run (after a crash or restart)
+    continues where the server left off instead of starting over. Network errors
+    mid-upload are resumed up to max_resume_attempts times.
+
+    The file ID is chosen client-side when not given, so every chunk is a
+    repeatable request and transient failures are retried per chunk.
+    """
+    file_path = Path(file_path)
+    size = file_path.stat().st_size
+    total_chunks = max(1, -(-size // chunk_size))
+    if not mime_type:
+        mime_type = mimetypes.guess_type(str(file_path))[0] or 'application/octet-stream'
+    
+    state_key = _upload_state_key(bucket_id, file_path)
+    upload_id = None
+    chunk_index = 0
+    
+    resume_id = _get_upload_state(state_key)
+    if resume_id:
+        uploaded, record = _get_uploaded_chunks(session, project_id, bucket_id, resume_id, endpoint)
+        if uploaded is not None:
+            if uploaded >= total_chunks:
+                _update_upload_state(state_key)
+                return record
+            print(f"⏯️  Resuming {file_path.name} at chunk {uploaded + 1}/{total_chunks}")
+            upload_id = resume_id
+            chunk_index = uploaded
+    
+    url = f"{endpoint}/storage/buckets/{bucket_id}/files"
+    result = None
+    attempts = 0
+    
+    with open(file_path, 'rb') as file:
+        while chunk_index < total_chunks:
+            start = chunk_index * chunk_size
+            file.seek(start)
+            chunk = file.read(chunk_size)
+            headers = {
+                "X-Appwrite-Project": project_id,
+                "Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{size}"
+            }
+            if upload_id:
+                headers["x-appwrite-id"] = upload_id
+            if not upload_id and file_id in (None, "unique()"):
+                file_id = new_id()
+            data = {
+                'fileId': upload_id or file_id
+            }
+            if permissions:
+                data['permissions'] = json.dumps(permissions)
             
-        page += 1
+            try:
+                response = _send_request(session, "POST", url, rate_limiter=rate_limiter, idempotent=True,
+                                         headers=headers, files={'file': (file_path.name, chunk, mime_type)},
+                                         data=data)
+            except requests.RequestException as e:
+                attempts += 1
+                if attempts > max_resume_attempts:
+                    print(f"❌ Error uploading {file_path.name} at chunk {chunk_index + 1}/{total_chunks}: {str(e)}")
+                    return None
+                if upload_id:
+                    # Ask the server how far it got before picking up again
+                    uploaded, _ = _get_uploaded_chunks(session, project_id, bucket_id, upload_id, endpoint)
+                    if uploaded is not None:
+                        chunk_index = uploaded
+                print(f"⏯️  Connection error on {file_path.name}, resuming at chunk {chunk_index + 1}/{total_chunks}")
+                continue
+            
+            if response.status_code != 201:
+                print(f"❌ Failed to upload {file_path.name} chunk {chunk_index + 1}/{total_chunks}: {response.text}")
+                return None
+            
+            result = response.json()
+            if upload_id is None:
+                upload_id = result['$id']
+                _update_upload_state(state_key, upload_id)
+            chunk_index += 1
     
-    print(f"❌ File '{file_name}' not found after searching {page} pages")
-    return None
+    _update_upload_state(state_key)
+    return result
 
-def delete_file_by_name_paginated(session, project_id, bucket_id, file_name, endpoint):
-    """Delete a file from bucket by its name using paginated search"""
-    
-    # Find the file first
-    target_file = find_file_by_name_paginated(session, project_id, bucket_id, file_name, endpoint)
-    
-    if not target_file:
-        print(f"❌ File not found for deletion: {file_name}")
-        return False
-    
-    # Delete the file using its ID
-    delete_url = f"{endpoint}/storage/buckets/{bucket_id}/files/{target_file['$id']}"
-    headers = {
-        "X-Appwrite-Project": project_id
+def file_md5(file_path, block_size=1024 * 1024):
+    """Hash a file's contents in blocks; matches the 'signature' Appwrite stores per file"""
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def get_content_hash_map(existing_files):
+    """Build a content hash -> file record map from a get_bucket_file_map result"""
+    return {
+        record['signature']: record
+        for record in existing_files.values()
+        if record.get('signature') and not _is_unfinished_upload(record)
     }
-    
-    delete_response = session.delete(delete_url, headers=headers)
-    
-    if delete_response.status_code == 204:
-        print(f"🗑️  Deleted existing file: {file_name} (ID: {target_file['$id']})")
-        return True
+
+def _delete_for_overwrite(session, project_id, bucket_id, endpoint, file_name, existing, existing_files, file_index):
+    """Delete the bucket copy of file_name ahead of re-uploading it"""
+    if existing:
+        deleted = delete_file_by_id(session, project_id, bucket_id, existing['$id'], endpoint, file_name=file_name)
     else:
-        print(f"❌ Failed to delete file {file_name}: {delete_response.text}")
+        deleted = delete_file_by_name_paginated(session, project_id, bucket_id, file_name, endpoint)
+    if not deleted:
+        print(f"❌ Failed to delete existing file for overwrite: {file_name}")
         return False
+    # Remove from existing_files since we're deleting it
+    if isinstance(existing_files, dict):
+        existing_files.pop(file_name, None)
+    else:
+        existing_files.discard(file_name)
+    if file_index is not None:
+        file_index.remove_name(file_name)
+    return True
+
+class _PendingUpload:
+    """Placeholder in an existing_hashes map while a file with that content is uploading"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+_content_hash_lock = threading.Lock()
+
+def _claim_content_hash(existing_hashes, content_hash):
+    """Return the bucket file already holding content_hash, or reserve it for this upload and return None.
 
-def upload_file_to_bucket_with_duplicate_check(session, project_id, bucket_id, file_path, endpoint, file_id=None, permissions=None, skip_duplicates=True, overwrite=False, existing_files=None):
-    """Upload a single file to Appwrite Storage bucket with duplicate checking"""
+    While another worker is uploading the same content, wait for its outcome.
+    """
+    while True:
+        with _content_hash_lock:
+            entry = existing_hashes.get(content_hash)
+            if entry is None:
+                existing_hashes[content_hash] = _PendingUpload()
+                return None
+            if not isinstance(entry, _PendingUpload):
+                return entry
+        entry.done.wait()
+
+def _release_content_hash(existing_hashes, content_hash, result):
+    """Replace a reservation with the uploaded file, or drop it so a waiting worker can try"""
+    with _content_hash_lock:
+        entry = existing_hashes.get(content_hash)
+        if result:
+            existing_hashes[content_hash] = result
+        elif isinstance(entry, _PendingUpload):
+            del existing_hashes[content_hash]
+    if isinstance(entry, _PendingUpload):
+        entry.done.set()
+
+def _track_uploaded_file(result, file_name, existing_files, file_index):
+    """Add a newly uploaded file to the run's existing-file map/set and the local index"""
+    if isinstance(existing_files, dict):
+        existing_files[file_name] = result
+    elif existing_files is not None:
+        existing_files.add(file_name)
+    if file_index is not None:
+        file_index.add(result)
+
+def upload_file_to_bucket_with_duplicate_check(session, project_id, bucket_id, file_path, endpoint, file_id=None, permissions=None, skip_duplicates=True, overwrite=False, existing_files=None, rate_limiter=None, file_index=None, chunk_size=UPLOAD_CHUNK_SIZE, existing_hashes=None):
+    """Upload a single file to Appwrite Storage bucket with duplicate checking.
+
+    existing_files may be a set of names or, better, the name -> file record map
+    from get_bucket_file_map: skipped duplicates then carry the existing file's
+    '$id' and overwrites delete by ID without searching the bucket. When a
+    BucketFileIndex is given it is kept in step with uploads and deletions.
+    Files larger than chunk_size are sent with upload_file_chunked.
+
+    Passing existing_hashes (see get_content_hash_map) switches duplicate checks
+    from names to content: the file's MD5 is compared with the signatures of
+    files already in the bucket. Identical bytes are skipped whatever their
+    name, and a same-named file with different bytes is uploaded as a new
+    version (replacing the old one when overwrite is set).
+
+    A chunked upload interrupted by an earlier run is listed in the bucket under
+    the file's name; it is resumed rather than skipped or deleted as a duplicate.
+    """
     
     file_path = Path(file_path)
     
@@ -653,29 +2529,83 @@ def upload_file_to_bucket_with_duplicate_check(session, project_id, bucket_id, f
         print(f"❌ File not found: {file_path}")
         return None
     
-    # Check for duplicates if existing_files set is provided
+    existing = None
     if existing_files is not None and file_path.name in existing_files:
-        if skip_duplicates and not overwrite:
-            print(f"⏭️  Skipping duplicate: {file_path.name} (already exists in bucket)")
-            return {'skipped': True, 'file_name': file_path.name, 'reason': 'duplicate'}
-        elif overwrite:
-            print(f"🔄 Overwriting existing file: {file_path.name}")
-            # For overwrite, we'll delete the existing file first
-            if not delete_file_by_name_paginated(session, project_id, bucket_id, file_path.name, endpoint):
-                print(f"❌ Failed to delete existing file for overwrite: {file_path.name}")
-                return None
-            # Remove from existing_files set since we're deleting it
-            existing_files.discard(file_path.name)
-    
-    # Generate file ID if not provided
-    if not file_id:
-        file_id = "unique()"
+        existing = existing_files.get(file_path.name) if isinstance(existing_files, dict) else None
+    
+    # The upload state is checked first: index records do not carry chunk counts
+    state_key = _upload_state_key(bucket_id, file_path)
+    resuming = _get_upload_state(state_key) is not None
+    if not resuming and _is_unfinished_upload(existing) and existing.get('sizeOriginal') == file_path.stat().st_size:
+        # Partial upload of this file whose local state was lost; pick it up by ID
+        _update_upload_state(state_key, existing['$id'])
+        resuming = True
+    
+    content_hash = None
+    if existing_hashes is not None:
+        content_hash = file_md5(file_path)
+        # Claimed under a lock, so parallel workers never upload the same bytes twice
+        match = _claim_content_hash(existing_hashes, content_hash)
+        if match:
+            print(f"⏭️  Skipping identical content: {file_path.name} (same as {match['name']}, ID: {match['$id']})")
+            return {'skipped': True, 'file_name': file_path.name, 'reason': 'identical content', '$id': match['$id']}
+    
+    result = None
+    try:
+        if resuming:
+            print(f"⏯️  Unfinished upload found for {file_path.name}")
+        elif content_hash is not None:
+            if existing:
+                print(f"🔁 Content changed: {file_path.name}, uploading new version")
+                if overwrite and not _delete_for_overwrite(session, project_id, bucket_id, endpoint, file_path.name,
+                                                           existing, existing_files, file_index):
+                    return None
+        # Check for duplicates if existing_files set is provided
+        elif existing_files is not None and file_path.name in existing_files and not _is_unfinished_upload(existing):
+            if skip_duplicates and not overwrite:
+                print(f"⏭️  Skipping duplicate: {file_path.name} (already exists in bucket)")
+                skipped = {'skipped': True, 'file_name': file_path.name, 'reason': 'duplicate'}
+                if existing:
+                    skipped['$id'] = existing['$id']
+                return skipped
+            elif overwrite:
+                print(f"🔄 Overwriting existing file: {file_path.name}")
+                # For overwrite, we'll delete the existing file first
+                if not _delete_for_overwrite(session, project_id, bucket_id, endpoint, file_path.name,
+                                             existing, existing_files, file_index):
+                    return None
+        
+        result = _send_file(session, project_id, bucket_id, file_path, endpoint, file_id, permissions,
+                            rate_limiter, chunk_size)
+        if result:
+            # Add to existing_files to track new uploads
+            _track_uploaded_file(result, file_path.name, existing_files, file_index)
+        return result
+    finally:
+        if content_hash is not None:
+            _release_content_hash(existing_hashes, content_hash, result)
+
+def _send_file(session, project_id, bucket_id, file_path, endpoint, file_id, permissions, rate_limiter, chunk_size):
+    """Upload file_path once the duplicate checks have passed; returns the file record or None"""
+    # Generate the file ID client-side if not provided, so a failed upload can be retried safely
+    generated_id = not file_id or file_id == "unique()"
+    if generated_id:
+        file_id = new_id()
     
     # Detect MIME type
     mime_type, _ = mimetypes.guess_type(str(file_path))
     if not mime_type:
         mime_type = 'application/octet-stream'
     
+    # Large files go up in resumable Content-Range chunks instead of one body
+    if file_path.stat().st_size > chunk_size:
+        result = upload_file_chunked(session, project_id, bucket_id, file_path, endpoint, file_id=file_id,
+                                     permissions=permissions, mime_type=mime_type, chunk_size=chunk_size,
+                                     rate_limiter=rate_limiter)
+        if result:
+            print(f"✅ Uploaded: {file_path.name} -> ID: {result['$id']}")
+        return result
+    
     url = f"{endpoint}/storage/buckets/{bucket_id}/files"
     headers = {
         "X-Appwrite-Project": project_id
@@ -695,14 +2625,20 @@ def upload_file_to_bucket_with_duplicate_check(session, project_id, bucket_id, f
         data['permissions'] = json.dumps(permissions)
     
     try:
-        response = session.post(url, headers=headers, files=files, data=data)
+        response = _send_request(session, "POST", url, rate_limiter=rate_limiter, idempotent=True,
+                                 headers=headers, files=files, data=data)
         
+        result = None
         if response.status_code == 201:
             result = response.json()
+        elif response.status_code == 409 and generated_id:
+            # A retried attempt whose first try had already been stored
+            _, result = _get_uploaded_chunks(session, project_id, bucket_id, file_id, endpoint)
+            if result and result.get('name') != file_path.name:
+                result = None
+        
+        if result:
             print(f"✅ Uploaded: {file_path.name} -> ID: {result['$id']}")
-            # Add to existing_files set to track new uploads
-            if existing_files is not None:
-                existing_files.add(file_path.name)
             return result
         else:
             print(f"❌ Failed to upload {file_path.name}: {response.text}")
@@ -720,8 +2656,76 @@ def delete_file_by_name(session, project_id, bucket_id, file_name, endpoint):
     """Delete a file from bucket by its name (legacy function - use delete_file_by_name_paginated for better results)"""
     return delete_file_by_name_paginated(session, project_id, bucket_id, file_name, endpoint)
 
-def bulk_upload_media_from_folder(session, project_id, bucket_id, folder_path, endpoint, permissions=None, extensions=None, media_type="images", skip_duplicates=True, overwrite=False):
-    """Upload all media files (images/videos) from a folder to Appwrite Storage bucket with duplicate checking"""
+# Default cap on upload bytes held in memory across parallel workers
+DEFAULT_MAX_BYTES_IN_FLIGHT = 64 * 1024 * 1024
+
+class _ByteBudget:
+    """Counting semaphore measured in bytes, shared by parallel upload workers"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, amount):
+        # A single item larger than the budget may run, but only on its own
+        amount = min(amount, self.capacity)
+        with self._condition:
+            while self._used and self._used + amount > self.capacity:
+                self._condition.wait()
+            self._used += amount
+        return amount
+
+    def release(self, amount):
+        with self._condition:
+            self._used -= amount
+            self._condition.notify_all()
+
+def _interleave_by_size(paths):
+    """Order files largest, smallest, second largest, second smallest, ...
+
+    Long uploads start first so they don't trail at the end of the run, while the
+    small files keep the remaining workers busy alongside them.
+    """
+    by_size = sorted(paths, key=lambda path: path.stat().st_size, reverse=True)
+    ordered = []
+    while by_size:
+        ordered.append(by_size.pop(0))
+        if by_size:
+            ordered.append(by_size.pop())
+    return ordered
+
+def _run_uploads(upload, paths, workers=1, max_bytes_in_flight=None):
+    """Call upload(position, path) for every path and return the results in input order.
+
+    With workers > 1 the uploads run on a thread pool, scheduled by
+    _interleave_by_size and limited to max_bytes_in_flight bytes of request
+    bodies (a whole file, or one chunk for chunked uploads) at any moment.
+    """
+    positions = {path: i for i, path in enumerate(paths, 1)}
+    if workers <= 1:
+        return [upload(positions[path], path) for path in paths]
+    
+    budget = _ByteBudget(max_bytes_in_flight or DEFAULT_MAX_BYTES_IN_FLIGHT)
+    
+    def upload_within_budget(path):
+        cost = budget.acquire(min(path.stat().st_size, UPLOAD_CHUNK_SIZE))
+        try:
+            return upload(positions[path], path)
+        finally:
+            budget.release(cost)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {path: executor.submit(upload_within_budget, path) for path in _interleave_by_size(paths)}
+        return [futures[path].result() for path in paths]
+
+def bulk_upload_media_from_folder(session, project_id, bucket_id, folder_path, endpoint, permissions=None, extensions=None, media_type="images", skip_duplicates=True, overwrite=False, rate_limiter=None, file_index=None, workers=1, max_bytes_in_flight=None, content_hash=False):
+    """Upload all media files (images/videos) from a folder to Appwrite Storage bucket with duplicate checking.
+
+    With workers > 1 files are uploaded in parallel, large and small files mixed,
+    within a max_bytes_in_flight memory budget (default 64 MB). content_hash=True
+    detects duplicates by file contents instead of names.
+    """
     
     folder_path = Path(folder_path)
     
@@ -755,21 +2759,29 @@ def bulk_upload_media_from_folder(session, project_id, bucket_id, folder_path, e
     
     # Get existing files for duplicate checking if enabled
     existing_files = None
-    if skip_duplicates or overwrite:
+    existing_hashes = None
+    if skip_duplicates or overwrite or content_hash:
         print("Checking for existing files in bucket...")
-        existing_files = get_bucket_file_names(session, project_id, bucket_id, endpoint)
+        try:
+            existing_files = get_bucket_file_map(session, project_id, bucket_id, endpoint, file_index=file_index)
+        except requests.RequestException as e:
+            # A partial listing would let duplicates through, so nothing is uploaded
+            print(f"❌ Could not list bucket {bucket_id}: {str(e)}")
+            return []
+    if content_hash:
+        existing_hashes = get_content_hash_map(existing_files)
     
     successful_uploads = []
     failed_uploads = []
     skipped_duplicates = []
     
-    for i, media_file in enumerate(media_files, 1):
+    def upload_one(i, media_file):
         file_size = media_file.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
         
         print(f"Processing {i}/{len(media_files)}: {media_file.name} ({file_size_mb:.2f} MB)")
         
-        result = upload_file_to_bucket_with_duplicate_check(
+        return upload_file_to_bucket_with_duplicate_check(
             session, 
             project_id, 
             bucket_id, 
@@ -778,9 +2790,17 @@ def bulk_upload_media_from_folder(session, project_id, bucket_id, folder_path, e
             permissions=permissions,
             skip_duplicates=skip_duplicates,
             overwrite=overwrite,
-            existing_files=existing_files
+            existing_files=existing_files,
+            rate_limiter=rate_limiter,
+            file_index=file_index,
+            existing_hashes=existing_hashes
         )
-        
+    
+    if workers > 1:
+        configure_connection_pool(session, workers)
+    results = _run_uploads(upload_one, media_files, workers=workers, max_bytes_in_flight=max_bytes_in_flight)
+    
+    for media_file, result in zip(media_files, results):
         if result:
             if result.get('skipped'):
                 skipped_duplicates.append({
@@ -798,10 +2818,6 @@ def bulk_upload_media_from_folder(session, project_id, bucket_id, folder_path, e
                 })
         else:
             failed_uploads.append(str(media_file))
-        
-        # Longer delay for video files to avoid rate limiting
-        delay = 0.5 if media_file.suffix.lower() in get_supported_video_extensions() else 0.1
-        time.sleep(delay)
     
     # Print comprehensive summary
     print("\n--- Upload Summary ---")
@@ -839,8 +2855,12 @@ def bulk_upload_media_from_folder(session, project_id, bucket_id, folder_path, e
     return successful_uploads
 
 def bulk_upload_files_from_folder(session, project_id, bucket_id, folder_path, endpoint, permissions=None,
-                                  skip_duplicates=True, overwrite=False):
-    """Upload all files from a folder to Appwrite Storage bucket."""
+                                  skip_duplicates=True, overwrite=False, rate_limiter=None, file_index=None,
+                                  workers=1, max_bytes_in_flight=None, content_hash=False):
+    """Upload all files from a folder to Appwrite Storage bucket.
+
+    workers, max_bytes_in_flight and content_hash work as in bulk_upload_media_from_folder.
+    """
 
     folder_path = Path(folder_path)
 
@@ -857,21 +2877,29 @@ def bulk_upload_files_from_folder(session, project_id, bucket_id, folder_path, e
     print(f"Found {len(all_files)} files to upload...")
 
     existing_files = None
-    if skip_duplicates or overwrite:
+    existing_hashes = None
+    if skip_duplicates or overwrite or content_hash:
         print("Checking for existing files in bucket...")
-        existing_files = get_bucket_file_names(session, project_id, bucket_id, endpoint)
+        try:
+            existing_files = get_bucket_file_map(session, project_id, bucket_id, endpoint, file_index=file_index)
+        except requests.RequestException as e:
+            # A partial listing would let duplicates through, so nothing is uploaded
+            print(f"❌ Could not list bucket {bucket_id}: {str(e)}")
+            return []
+    if content_hash:
+        existing_hashes = get_content_hash_map(existing_files)
 
     successful_uploads = []
     failed_uploads = []
     skipped_duplicates = []
 
-    for i, file_path in enumerate(all_files, 1):
+    def upload_one(i, file_path):
         file_size = file_path.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
 
         print(f"Processing {i}/{len(all_files)}: {file_path.name} ({file_size_mb:.2f} MB)")
 
-        result = upload_file_to_bucket_with_duplicate_check(
+        return upload_file_to_bucket_with_duplicate_check(
             session,
             project_id,
             bucket_id,
@@ -880,9 +2908,17 @@ def bulk_upload_files_from_folder(session, project_id, bucket_id, folder_path, e
             permissions=permissions,
             skip_duplicates=skip_duplicates,
             overwrite=overwrite,
-            existing_files=existing_files
+            existing_files=existing_files,
+            rate_limiter=rate_limiter,
+            file_index=file_index,
+            existing_hashes=existing_hashes
         )
 
+    if workers > 1:
+        configure_connection_pool(session, workers)
+    results = _run_uploads(upload_one, all_files, workers=workers, max_bytes_in_flight=max_bytes_in_flight)
+
+    for file_path, result in zip(all_files, results):
         if result:
             if result.get('skipped'):
                 skipped_duplicates.append({
@@ -900,8 +2936,6 @@ def bulk_upload_files_from_folder(session, project_id, bucket_id, folder_path, e
         else:
             failed_uploads.append(str(file_path))
 
-        time.sleep(0.1)
-
     print("\n--- Upload Summary ---")
     print(f"Total files found: {len(all_files)}")
     print(f"Successfully uploaded: {len(successful_uploads)}")
@@ -921,9 +2955,11 @@ def bulk_upload_files_from_folder(session, project_id, bucket_id, folder_path, e
     return successful_uploads
 
 def list_bucket_files(session, project_id, bucket_id, endpoint):
-    """List all files in a storage bucket with full pagination support"""
+    """List all files in a storage bucket with full pagination support; returns None on failure"""
     
     files = get_all_bucket_files_detailed(session, project_id, bucket_id, endpoint)
+    if files is None:
+        return None
     
     if files:
         print(f"✅ Found {len(files)} total files in bucket {bucket_id}")
@@ -943,6 +2979,333 @@ def list_bucket_files(session, project_id, bucket_id, endpoint):
         print(f"❌ No files found or failed to retrieve files from bucket {bucket_id}")
         return []
 
+# Bytes written to disk per read while streaming a download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Records size, mtime and MD5 of mirrored files so unchanged ones are not re-hashed
+MIRROR_MANIFEST_NAME = ".appwrite-mirror.json"
+
+def download_file(session, project_id, bucket_id, file_record, target, endpoint, verify_hash=True, rate_limiter=None, max_resume_attempts=3):
+    """Stream one bucket file to target, resuming from a partial target.part file.
+
+    Data is written to disk as it arrives. An existing .part file is continued
+    with an HTTP Range request, and connection drops mid-transfer are resumed up
+    to max_resume_attempts times. The file is moved into place only after its
+    size (and, with verify_hash, its MD5 against Appwrite's signature) checks
+    out. Returns (status, bytes received), status being "downloaded", "resumed"
+    or "failed".
+    """
+    url = f"{endpoint}/storage/buckets/{bucket_id}/files/{file_record['$id']}/download"
+    size = file_record.get("sizeOriginal")
+    part = target.with_name(target.name + ".part")
+    resumed = part.exists() and part.stat().st_size > 0
+    received = 0
+    attempts = 0
+    while True:
+        offset = part.stat().st_size if part.exists() else 0
+        if size is not None and offset > size:
+            part.unlink()
+            offset = 0
+        headers = {"X-Appwrite-Project": project_id}
+        if offset and (size is None or offset < size):
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            if size is not None and offset == size:
+                break  # Complete .part from a run that stopped before renaming it
+            with _send_request(session, "GET", url, rate_limiter=rate_limiter, headers=headers,
+                               stream=True) as response:
+                if response.status_code not in (200, 206):
+                    print(f"❌ Failed to download {file_record['name']}: {response.text}")
+                    return "failed", received
+                # 200 means the server ignored the Range header and sent the whole file
+                with open(part, 'ab' if response.status_code == 206 else 'wb') as out:
+                    for block in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        out.write(block)
+                        received += len(block)
+            break
+        except requests.RequestException as e:
+            attempts += 1
+            if attempts > max_resume_attempts:
+                print(f"❌ Error downloading {file_record['name']}: {str(e)}")
+                return "failed", received
+            resumed = True
+            print(f"⏯️  Connection error on {file_record['name']}, resuming download")
+    
+    if size is not None and part.stat().st_size != size:
+        print(f"❌ Size mismatch for {file_record['name']}: expected {size} bytes, got {part.stat().st_size}")
+        part.unlink()
+        return "failed", received
+    if verify_hash and file_record.get("signature") and file_md5(part) != file_record["signature"]:
+        print(f"❌ Checksum mismatch for {file_record['name']}, discarding download")
+        part.unlink()
+        return "failed", received
+    os.replace(part, target)
+    return ("resumed" if resumed else "downloaded"), received
+
+def mirror_bucket(session, project_id, bucket_id, endpoint, dest_dir, workers=4, verify_hash=True, rate_limiter=None):
+    """Download every file in a bucket into dest_dir, skipping files that are already there.
+
+    The bucket listing is streamed with cursor pagination and files are fetched by
+    a pool of workers, each streaming straight to disk (see download_file). A
+    local file is skipped when its size matches and, with verify_hash, its MD5
+    matches Appwrite's signature; hashes are remembered in a manifest file in
+    dest_dir so unchanged files are not re-read on the next run. Files with the
+    same name are saved as "name-<file ID>". Returns a dict of counts per outcome,
+    or None if the bucket listing failed part-way.
+    """
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = dest_dir / MIRROR_MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    manifest_lock = threading.Lock()
+    
+    def remember(name, target, digest):
+        stat = target.stat()
+        with manifest_lock:
+            manifest[name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "md5": digest}
+    
+    def local_md5(name, target):
+        """MD5 of a local file, reusing the manifest's hash while its size and mtime are unchanged"""
+        stat = target.stat()
+        with manifest_lock:
+            entry = manifest.get(name)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["md5"]
+        digest = file_md5(target)
+        remember(name, target, digest)
+        return digest
+    
+    def local_name(file_record, used):
+        # Only the base name is used, so names cannot point outside dest_dir
+        name = Path(file_record["name"]).name or file_record["$id"]
+        if name in used or name == MIRROR_MANIFEST_NAME:
+            name = f"{Path(name).stem}-{file_record['$id']}{Path(name).suffix}"
+        used.add(name)
+        return name
+    
+    def mirror_one(item):
+        file_record, name = item
+        target = dest_dir / name
+        if target.exists() and target.stat().st_size == file_record.get("sizeOriginal"):
+            if not verify_hash or not file_record.get("signature"):
+                return "skipped", 0
+            if local_md5(name, target) == file_record["signature"]:
+                return "skipped", 0
+        status, received = download_file(session, project_id, bucket_id, file_record, target, endpoint,
+                                         verify_hash=verify_hash, rate_limiter=rate_limiter)
+        if status != "failed":
+            if verify_hash and file_record.get("signature"):
+                # download_file has just checked the contents against the signature
+                remember(name, target, file_record["signature"])
+            print(f"✅ {'Resumed' if status == 'resumed' else 'Downloaded'}: {name}")
+        return status, received
+    
+    def listing():
+        used = set()
+        for file_record in iter_bucket_files(session, project_id, bucket_id, endpoint):
+            yield file_record, local_name(file_record, used)
+    
+    counts = {"downloaded": 0, "resumed": 0, "skipped": 0, "failed": 0}
+    total_bytes = 0
+    started = time.monotonic()
+    print(f"Mirroring bucket {bucket_id} into {dest_dir}")
+    listing_error = None
+    try:
+        with _ordered_map(session, mirror_one, listing(), workers) as results:
+            for status, received in results:
+                counts[status] += 1
+                total_bytes += received
+    except requests.RequestException as e:
+        listing_error = e
+    finally:
+        with manifest_lock:
+            manifest_path.write_text(json.dumps(manifest))
+    
+    elapsed = time.monotonic() - started
+    print("\n--- Mirror Summary ---")
+    print(f"Downloaded: {counts['downloaded']}")
+    print(f"Resumed: {counts['resumed']}")
+    print(f"Skipped (unchanged): {counts['skipped']}")
+    print(f"Failed: {counts['failed']}")
+    print(f"Transferred {total_bytes / (1024 * 1024):.1f} MB in {elapsed:.1f}s "
+          f"({total_bytes / (1024 * 1024) / max(elapsed, 1e-9):.1f} MB/s)")
+    if listing_error is not None:
+        print(f"❌ Bucket listing failed, mirror is incomplete: {str(listing_error)}")
+        return None
+    return counts
+
+# --- Async Engine ---
+#
+# Coroutine versions of the document and storage operations, built on a single
+# httpx.AsyncClient whose keep-alive pool is shared by every in-flight call.
+# Requires `pip install httpx`.
+
+async def create_async_session(email, password, project_id, endpoint, verify_ssl=True, max_connections=100):
+    """Create an authenticated httpx.AsyncClient with a keep-alive connection pool.
+
+    Calls beyond max_connections wait for a free pooled connection instead of
+    opening new sockets, so thousands of coroutines can share one client.
+    """
+    if httpx is None:
+        print("❌ The async engine requires httpx: pip install httpx")
+        return None
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    # No pool timeout: queued calls wait for a connection rather than failing
+    timeout = httpx.Timeout(30.0, pool=None)
+    client = httpx.AsyncClient(verify=verify_ssl, limits=limits, timeout=timeout)
+
+    login_url = f"{endpoint}/account/sessions/email"
+    login_headers = {
+        "X-Appwrite-Project": project_id,
+        "Content-Type": "application/json"
+    }
+    login_data = {
+        "email": email,
+        "password": password
+    }
+
+    response = await client.post(login_url, headers=login_headers, json=login_data)
+
+    if response.status_code != 201:
+        print(f"❌ Login failed: {response.text}")
+        await client.aclose()
+        return None
+
+    print(f"✅ Login successful!")
+    return client
+
+async def create_document_async(client, project_id, database_id, collection_id, data, endpoint, document_id="unique()"):
+    """Create a document using an async client"""
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    headers = {
+        "X-Appwrite-Project": project_id,
+        "Content-Type": "application/json"
+    }
+    response = await client.post(url, headers=headers, json={"documentId": document_id, "data": data})
+    if response.status_code != 201:
+        print(f"❌ Failed to create document: {response.text}")
+        return None
+    return response.json()
+
+async def get_document_async(client, project_id, database_id, collection_id, document_id, endpoint):
+    """Retrieve a document by its ID using an async client"""
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents/{document_id}"
+    headers = {"X-Appwrite-Project": project_id}
+    response = await client.get(url, headers=headers)
+    if response.status_code != 200:
+        print(f"❌ Failed to get document (ID: {document_id}): {response.text}")
+        return None
+    return response.json()
+
+async def update_document_async(client, project_id, database_id, collection_id, document_id, data, endpoint):
+    """Update a document using an async client"""
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents/{document_id}"
+    headers = {
+        "X-Appwrite-Project": project_id,
+        "Content-Type": "application/json"
+    }
+    response = await client.patch(url, headers=headers, json={"data": data})
+    if response.status_code != 200:
+        print(f"❌ Failed to update document {document_id}: {response.text}")
+        return None
+    return response.json()
+
+async def delete_document_async(client, project_id, database_id, collection_id, document_id, endpoint):
+    """Delete a document using an async client"""
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents/{document_id}"
+    headers = {"X-Appwrite-Project": project_id}
+    response = await client.delete(url, headers=headers)
+    if response.status_code != 204:
+        print(f"❌ Failed to delete document {document_id}: {response.text}")
+        return False
+    return True
+
+async def get_collection_documents_async(client, project_id, database_id, collection_id, endpoint):
+    """Get documents from a collection using an async client"""
+    url = f"{endpoint}/databases/{database_id}/collections/{collection_id}/documents"
+    headers = {"X-Appwrite-Project": project_id}
+    response = await client.get(url, headers=headers)
+    if response.status_code != 200:
+        print(f"❌ Failed to fetch documents: {response.text}")
+        return None
+    return response.json()
+
+async def upload_file_async(client, project_id, bucket_id, file_path, endpoint, file_id=None, permissions=None):
+    """Upload a single file to a storage bucket using an async client"""
+    file_path = Path(file_path)
+    if not file_path.exists():
+        print(f"❌ File not found: {file_path}")
+        return None
+
+    mime_type, _ = mimetypes.guess_type(str(file_path))
+    if not mime_type:
+        mime_type = 'application/octet-stream'
+
+    url = f"{endpoint}/storage/buckets/{bucket_id}/files"
+    headers = {"X-Appwrite-Project": project_id}
+    # Read the file off the event loop so other coroutines keep running
+    content = await asyncio.to_thread(file_path.read_bytes)
+    files = {'file': (file_path.name, content, mime_type)}
+    data = {'fileId': file_id or "unique()"}
+    if permissions:
+        data['permissions'] = json.dumps(permissions)
+
+    response = await client.post(url, headers=headers, files=files, data=data)
+    if response.status_code != 201:
+        print(f"❌ Failed to upload {file_path.name}: {response.text}")
+        return None
+    return response.json()
+
+async def find_file_by_name_async(client, project_id, bucket_id, file_name, endpoint):
+    """Find a file in a bucket by its name using an async client"""
+    url = f"{endpoint}/storage/buckets/{bucket_id}/files"
+    headers = {"X-Appwrite-Project": project_id}
+
+    response = await client.get(url, headers=headers, params={'search': file_name, 'limit': 100})
+    if response.status_code == 200:
+        files_data = response.json()
+        for file in files_data.get('files', files_data.get('documents', [])):
+            if file['name'] == file_name:
+                return file
+
+    cursor = None
+    while True:
+        page_queries = [_query("limit", values=[100])]
+        if cursor:
+            page_queries.append(_query("cursorAfter", values=[cursor]))
+        response = await client.get(url, headers=headers, params={"queries[]": page_queries})
+        if response.status_code != 200:
+            print(f"❌ Failed to search after cursor {cursor}: {response.text}")
+            return None
+        files = response.json().get('files', [])
+        for file in files:
+            if file['name'] == file_name:
+                return file
+        if len(files) < 100:
+            return None
+        cursor = files[-1]['$id']
+
+async def delete_file_async(client, project_id, bucket_id, file_id, endpoint):
+    """Delete a file from a bucket by its ID using an async client"""
+    url = f"{endpoint}/storage/buckets/{bucket_id}/files/{file_id}"
+    headers = {"X-Appwrite-Project": project_id}
+    response = await client.delete(url, headers=headers)
+    if response.status_code != 204:
+        print(f"❌ Failed to delete file {file_id}: {response.text}")
+        return False
+    return True
+
+async def delete_file_by_name_async(client, project_id, bucket_id, file_name, endpoint):
+    """Delete a file from a bucket by its name using an async client"""
+    target_file = await find_file_by_name_async(client, project_id, bucket_id, file_name, endpoint)
+    if not target_file:
+        print(f"❌ File not found for deletion: {file_name}")
+        return False
+    return await delete_file_async(client, project_id, bucket_id, target_file['$id'], endpoint)
+
 def generate_team_permissions(team_id):
     """
     Generate basic permission strings for a team with the given team_id.
@@ -962,9 +3325,13 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Bulk create documents in Appwrite from YAML data and upload images")
-    parser.add_argument("--yaml-file", help="Path to YAML file containing document data")
+    parser.add_argument("--yaml-file", help="Path to YAML, JSONL or CSV file containing document data")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, help="Format of --yaml-file (default: from the file extension)")
+    parser.add_argument("--csv-types", help="Types for CSV columns, e.g. price:float,beds:integer,tags:json (default: string)")
     parser.add_argument("--email", help="Appwrite login email")
     parser.add_argument("--password", help="Appwrite login password")
+    parser.add_argument("--api-key", help="Appwrite API key to use instead of email/password login")
+    parser.add_argument("--no-session-cache", action="store_true", help="Log in on every run instead of reusing the cached session")
     parser.add_argument("--project-id", help="Appwrite project ID")
     parser.add_argument("--database-id", help="Appwrite database ID")
     parser.add_argument("--collection-id", help="Appwrite collection ID")
@@ -982,6 +3349,9 @@ if __name__ == "__main__":
                         help="Type of media to upload (images, videos, or all)")
     parser.add_argument("--check-bucket", action="store_true", help="Check if storage bucket exists")
     parser.add_argument("--list-files", action="store_true", help="List files in storage bucket")
+    parser.add_argument("--mirror-bucket", metavar="DIR", help="Download every file in the bucket into DIR, skipping files that are already up to date")
+    parser.add_argument("--download-workers", type=int, default=4, help="Number of files to download in parallel with --mirror-bucket (default: 4)")
+    parser.add_argument("--skip-hash-check", action="store_true", help="With --mirror-bucket, compare local files by size only")
     parser.add_argument("--media-extensions", nargs="+", help="Supported media extensions (default: auto-detect by type)")
     parser.add_argument("--image-extensions", nargs="+", help="Supported image extensions (legacy)")
     parser.add_argument("--video-extensions", nargs="+", help="Supported video extensions")
@@ -989,14 +3359,44 @@ if __name__ == "__main__":
     parser.add_argument("--skip-duplicates", action="store_true", default=True, help="Skip files that already exist in bucket (default: True)")
     parser.add_argument("--no-skip-duplicates", action="store_true", help="Upload all files even if duplicates exist")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing files with same name")
+    parser.add_argument("--upload-workers", type=int, default=1, help="Number of files to upload in parallel (default: 1)")
+    parser.add_argument("--max-upload-mb", type=float, help="Limit on upload data held in memory across workers, in MB (default: 64)")
+    parser.add_argument("--dedupe-content", action="store_true", help="Detect duplicate uploads by file contents (MD5) instead of file names")
+    parser.add_argument("--file-index", nargs="?", const=str(DEFAULT_FILE_INDEX_PATH),
+                        help="Use a local SQLite index of bucket file names for duplicate checks (optional path)")
+    parser.add_argument("--refresh-index", action="store_true", help="Rebuild the local file index from a full bucket scan")
     
     # Test arguments
     parser.add_argument("--test-connection", action="store_true", help="Test connection to Appwrite")
     parser.add_argument("--check-database", action="store_true", help="Check if database exists")
     parser.add_argument("--check-collection", action="store_true", help="Check if collection exists")
     parser.add_argument("--list-documents", action="store_true", help="List documents from a collection")
+    parser.add_argument("--export", metavar="PATH", help="Export every document in the collection to a JSONL, Parquet or Arrow file")
+    parser.add_argument("--export-format", choices=EXPORT_FORMATS, help="Format of --export (default: from the file extension)")
+    parser.add_argument("--attributes", nargs="+", help="With --export, only export these attributes")
+    parser.add_argument("--partitions", type=int, default=1, help="With --export, read the collection as this many parallel $id ranges (default: 1)")
     parser.add_argument("--create-document", action="store_true", help="Create a single document from the first YAML entry")
+    parser.add_argument("--delete-all-documents", action="store_true", help="Delete every document in the collection (cannot be undone)")
+    parser.add_argument("--update-documents", action="store_true", help="Update existing documents from the input file (entries carry a documentId)")
+    parser.add_argument("--no-diff", action="store_true", help="With --update-documents, send every listed field instead of only changed ones")
+    parser.add_argument("--sync-key", help="Reconcile the collection with the input file, matching records on these comma-separated fields")
+    parser.add_argument("--no-delete", action="store_true", help="With --sync-key, keep documents that are not in the input file")
+    parser.add_argument("--dry-run", action="store_true", help="With --sync-key, print the planned changes without applying them")
     parser.add_argument("--relations", action="store_true", help="Process YAML file with Children/Parent relationships")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of parallel requests for bulk document creation, updates, sync, deletion and relationship loading (default: 1)")
+    parser.add_argument("--skip-verify", action="store_true", help="Do not read parent documents back after creating relationships")
+    parser.add_argument("--batch-size", type=int, help="Create documents in batches of this size using the bulk documents endpoint (max 100)")
+    parser.add_argument("--journal", nargs="?", const="",
+                        help="Log bulk import results so an interrupted run can be resumed (optional path; default under ~/.cache/appwrite-client/journals)")
+    parser.add_argument("--deterministic-ids", action="store_true", help="Derive document IDs from row content so re-sent rows are never duplicated")
+    parser.add_argument("--yaml-cache", action="store_true", help="Cache the parsed YAML file so re-runs on an unchanged file skip parsing")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE, help=f"Connections kept open to Appwrite (default: {DEFAULT_POOL_SIZE}, raised to the worker count)")
+    parser.add_argument("--connect-timeout", type=float, default=DEFAULT_TIMEOUT[0], help=f"Seconds to wait for a connection (default: {DEFAULT_TIMEOUT[0]:g})")
+    parser.add_argument("--read-timeout", type=float, default=DEFAULT_TIMEOUT[1], help=f"Seconds to wait for a response before giving up on a stalled socket (default: {DEFAULT_TIMEOUT[1]:g})")
+    parser.add_argument("--no-keepalive", action="store_true", help="Do not enable TCP keep-alive on pooled connections")
+    parser.add_argument("--max-retries", type=int, help="Attempts per request for transient failures such as HTTP 503 or timeouts (default: 5)")
+    parser.add_argument("--retry-budget", type=int, help="Total retries allowed across the whole run (default: 200)")
+    parser.add_argument("--max-rate", type=float, help="Upper bound in requests/second for the adaptive rate limiter (default: 200)")
 
     args = parser.parse_args()
     
@@ -1004,24 +3404,60 @@ if __name__ == "__main__":
     email = args.email or os.environ.get("APPWRITE_EMAIL")
     password = args.password or os.environ.get("APPWRITE_PASSWORD")
     project_id = args.project_id or os.environ.get("APPWRITE_PROJECT_ID")
+    api_key = args.api_key or os.environ.get("APPWRITE_API_KEY")
     endpoint = os.environ.get("APPWRITE_API_ENDPOINT")
     
-    if not email or not password or not project_id:
-        print("Error: Missing credentials. Provide --email, --password, and --project-id or set them in .env/environment variables.")
+    if not project_id or not (api_key or (email and password)):
+        print("Error: Missing credentials. Provide --project-id and either --api-key or --email and --password, or set them in .env/environment variables.")
+        sys.exit(1)
+    
+    try:
+        column_types = parse_column_types(args.csv_types)
+    except ValueError as e:
+        print(f"Error: {str(e)}")
         sys.exit(1)
     
     # Create client
-    session = create_session(
-        email=email,
-        password=password,
-        project_id=project_id,
-        endpoint=endpoint,
-        verify_ssl=not args.no_verify_ssl
-    )
+    transport = {
+        "verify_ssl": not args.no_verify_ssl,
+        "pool_size": args.pool_size,
+        "timeout": (args.connect_timeout, args.read_timeout),
+        "keepalive": not args.no_keepalive,
+    }
+    if api_key:
+        session = create_api_key_session(project_id, api_key, **transport)
+    else:
+        session = create_session(
+            email=email,
+            password=password,
+            project_id=project_id,
+            endpoint=endpoint,
+            cache_session=not args.no_session_cache,
+            **transport
+        )
     
     if not session:
         sys.exit(1)
     
+    if args.max_rate:
+        get_default_rate_limiter().max_rate = args.max_rate
+    if args.max_retries is not None:
+        get_default_retry_policy().max_attempts = args.max_retries
+    if args.retry_budget is not None:
+        get_default_retry_policy().budget = args.retry_budget
+    
+    max_bytes_in_flight = int(args.max_upload_mb * 1024 * 1024) if args.max_upload_mb else None
+    
+    file_index = None
+    if args.file_index and args.bucket_id:
+        file_index = BucketFileIndex(endpoint, project_id, args.bucket_id, path=args.file_index)
+        if args.refresh_index:
+            try:
+                file_index.refresh(session, project_id, endpoint, full=True)
+            except requests.RequestException as e:
+                print(f"❌ Failed to refresh the file index: {str(e)}")
+                sys.exit(1)
+    
     # Handle test options using the session
     if args.test_connection:
         if test_connection_with_session(session, project_id, endpoint):
@@ -1057,6 +3493,16 @@ if __name__ == "__main__":
         files = list_bucket_files(session, project_id, args.bucket_id, endpoint)
         sys.exit(0 if files is not None else 1)
 
+    # Handle bucket mirror
+    if args.mirror_bucket:
+        if not args.bucket_id:
+            print("Error: Bucket ID not provided. Use --bucket-id.")
+            sys.exit(1)
+
+        counts = mirror_bucket(session, project_id, args.bucket_id, endpoint, args.mirror_bucket,
+                               workers=args.download_workers, verify_hash=not args.skip_hash_check)
+        sys.exit(1 if counts is None or counts["failed"] else 0)
+
     # Handle generic file upload
     if args.upload_files:
         folder_path = args.media_folder
@@ -1091,7 +3537,11 @@ if __name__ == "__main__":
             endpoint,
             permissions=permissions,
             skip_duplicates=skip_duplicates,
-            overwrite=overwrite
+            overwrite=overwrite,
+            file_index=file_index,
+            workers=args.upload_workers,
+            max_bytes_in_flight=max_bytes_in_flight,
+            content_hash=args.dedupe_content
         )
 
         sys.exit(0 if successful_uploads else 1)
@@ -1148,7 +3598,11 @@ if __name__ == "__main__":
             extensions=extensions,
             media_type=media_type,
             skip_duplicates=skip_duplicates,
-            overwrite=overwrite
+            overwrite=overwrite,
+            file_index=file_index,
+            workers=args.upload_workers,
+            max_bytes_in_flight=max_bytes_in_flight,
+            content_hash=args.dedupe_content
         )
         
         sys.exit(0 if successful_uploads else 1)
@@ -1195,7 +3649,11 @@ if __name__ == "__main__":
             extensions=extensions,
             media_type="images",
             skip_duplicates=skip_duplicates,
-            overwrite=overwrite
+            overwrite=overwrite,
+            file_index=file_index,
+            workers=args.upload_workers,
+            max_bytes_in_flight=max_bytes_in_flight,
+            content_hash=args.dedupe_content
         )
         
         sys.exit(0 if successful_uploads else 1)
@@ -1225,17 +3683,17 @@ if __name__ == "__main__":
             print("Error: Need both --database-id and --collection-id for listing documents")
             sys.exit(1)
         
-        documents = get_collection_documents_with_session(
-            session,
-            project_id,
-            args.database_id,
-            args.collection_id,
-            endpoint
-        )
-        
-        if documents:
-            print("\n--- Document List ---")
-            for doc in documents['documents']:
+        print("\n--- Document List ---")
+        listed = 0
+        try:
+            for doc in iter_collection_documents(
+                session,
+                project_id,
+                args.database_id,
+                args.collection_id,
+                endpoint
+            ):
+                listed += 1
                 print(f"ID: {doc['$id']}")
                 print(f"Created: {doc['$createdAt']}")
                 # Print a few key fields from each document
@@ -1243,9 +3701,44 @@ if __name__ == "__main__":
                     if not key.startswith('$') and not isinstance(value, dict) and not isinstance(value, list):
                         print(f"{key}: {value}")
                 print("-" * 30)
-            sys.exit(0)
-        else:
+        except requests.RequestException as e:
+            print(f"❌ Failed to list documents after {listed} documents: {str(e)}")
+            sys.exit(1)
+        print(f"✅ Listed {listed} documents")
+        sys.exit(0)
+    
+    # Handle collection export with session
+    if args.export:
+        if not all([args.database_id, args.collection_id]):
+            print("Error: Need --database-id and --collection-id for exporting documents")
+            sys.exit(1)
+        exported = export_collection(
+            session,
+            project_id,
+            args.database_id,
+            args.collection_id,
+            endpoint,
+            args.export,
+            output_format=args.export_format,
+            attributes=args.attributes,
+            partitions=args.partitions
+        )
+        sys.exit(0 if exported is not None else 1)
+    
+    # Handle collection purge with session
+    if args.delete_all_documents:
+        if not all([args.database_id, args.collection_id]):
+            print("Error: Need --database-id and --collection-id for deleting all documents")
             sys.exit(1)
+        deleted = delete_all_documents_with_session(
+            session,
+            project_id,
+            args.database_id,
+            args.collection_id,
+            endpoint,
+            concurrency=args.concurrency
+        )
+        sys.exit(0 if deleted is not None else 1)
     
     # Handle create single document with session
     if args.create_document:
@@ -1253,9 +3746,9 @@ if __name__ == "__main__":
             print("Error: Need --yaml-file, --database-id, and --collection-id for creating a document")
             sys.exit(1)
         
-        # Load only the first item from the YAML file
-        data = load_yaml_data(args.yaml_file)
-        if not data or len(data) == 0:
+        # Parse only the first item from the input file
+        first_item = next(iter_input_documents(args.yaml_file, args.input_format, column_types), None)
+        if first_item is None:
             print("Error: No data found in YAML file")
             sys.exit(1)
         
@@ -1264,7 +3757,7 @@ if __name__ == "__main__":
             project_id, 
             args.database_id, 
             args.collection_id, 
-            data[0],  # Use the first item only
+            first_item,
             endpoint
         )
         
@@ -1295,17 +3788,74 @@ if __name__ == "__main__":
             collection_mapping,
             endpoint,
             bucket_id=args.bucket_id,
+            file_index=file_index,
+            concurrency=args.concurrency,
+            verify=not args.skip_verify,
+            yaml_cache=args.yaml_cache,
         )
         sys.exit(0)    
 
+    # Handle collection sync with session
+    if args.sync_key:
+        if not all([args.yaml_file, args.database_id, args.collection_id]):
+            print("Error: Need --yaml-file, --database-id, and --collection-id for syncing a collection")
+            sys.exit(1)
+        counts = sync_collection_with_session(
+            session,
+            args.yaml_file,
+            project_id,
+            args.database_id,
+            args.collection_id,
+            endpoint,
+            [field.strip() for field in args.sync_key.split(",") if field.strip()],
+            delete_missing=not args.no_delete,
+            concurrency=args.concurrency,
+            dry_run=args.dry_run,
+            yaml_cache=args.yaml_cache,
+            input_format=args.input_format,
+            column_types=column_types
+        )
+        sys.exit(0 if counts is not None and not counts["failed"] else 1)
+    
+    # Handle bulk document update with session
+    if args.update_documents:
+        if not all([args.yaml_file, args.database_id, args.collection_id]):
+            print("Error: Need --yaml-file, --database-id, and --collection-id for updating documents")
+            sys.exit(1)
+        bulk_update_documents_with_session(
+            session,
+            args.yaml_file,
+            project_id,
+            args.database_id,
+            args.collection_id,
+            endpoint,
+            yaml_cache=args.yaml_cache,
+            input_format=args.input_format,
+            column_types=column_types,
+            concurrency=args.concurrency,
+            diff=not args.no_diff
+        )
+        sys.exit(0)
+    
     # Handle bulk document creation with session
     if args.yaml_file and args.database_id and args.collection_id and not args.create_document:
+        journal = None
+        if args.journal is not None:
+            journal = args.journal or default_journal_path(args.yaml_file, endpoint, project_id,
+                                                           args.database_id, args.collection_id)
         bulk_create_documents_with_session(
             session,
             args.yaml_file,
             project_id,
             args.database_id,
             args.collection_id,
-            endpoint
+            endpoint,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            yaml_cache=args.yaml_cache,
+            input_format=args.input_format,
+            column_types=column_types,
+            journal=journal,
+            deterministic_ids=args.deterministic_ids
         )
         sys.exit(0)
\ No newline at end of file
@@ -0,0 +1,248 @@
+"""End-to-end benchmarks for appwrite-client.py against the bundled mock Appwrite server.
+
+Each scenario drives the client's real bulk functions against an in-process
+MockAppwriteServer and reports throughput (docs/s, files/s, MB/s) and the p50/p99
+latency of the HTTP requests it made. Save results with --output and compare a
+later run (e.g. the next release) against them with --compare:
+
+    python benchmark.py --output baseline.json
+    python benchmark.py --compare baseline.json
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from mock_appwrite_server import MockAppwriteServer
+
+HERE = Path(__file__).resolve().parent
+PROJECT_ID = "benchmark"
+DATABASE_ID = "benchmark"
+SCENARIOS = ("bulk_create", "bulk_update", "relationships", "upload", "mirror", "delete")
+# Metrics compared between runs; for latencies lower is better
+COMPARED_METRICS = ("docs_per_sec", "files_per_sec", "mb_per_sec", "p50_ms", "p99_ms")
+
+
+def load_client():
+    """Import appwrite-client.py (its file name is not a valid module name)"""
+    spec = importlib.util.spec_from_file_location("appwrite_client", HERE / "appwrite-client.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class LatencyRecorder:
+    """requests response hook that records the round-trip time of every response"""
+
+    def __init__(self):
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def hook(self, response, *args, **kwargs):
+        with self._lock:
+            self.samples.append(response.elapsed.total_seconds())
+
+    def reset(self):
+        with self._lock:
+            self.samples = []
+
+    def percentile(self, percent):
+        with self._lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, round(percent / 100 * (len(samples) - 1)))]
+
+
+def _write_jsonl(path, rows):
+    with open(path, "w") as file:
+        for row in rows:
+            file.write(json.dumps(row) + "\n")
+
+
+def bulk_create(client, server, session, args, workdir):
+    path = workdir / "create.jsonl"
+    _write_jsonl(path, ({"title": f"Property {i}", "price": i * 1000.0, "city": f"City {i % 50}"}
+                        for i in range(args.documents)))
+    client.bulk_create_documents_with_session(session, path, PROJECT_ID, DATABASE_ID, "bench_documents",
+                                              server.endpoint, concurrency=args.concurrency,
+                                              batch_size=args.batch_size)
+    return {"docs": len(server.collection("bench_documents"))}
+
+
+def bulk_update(client, server, session, args, workdir):
+    documents = list(server.collection("bench_documents").values())
+    if not documents:
+        bulk_create(client, server, session, args, workdir)
+        documents = list(server.collection("bench_documents").values())
+    # Half the rows change a field; the other half are no-ops the diff should skip
+    path = workdir / "update.jsonl"
+    _write_jsonl(path, ({"documentId": doc["$id"], "price": doc.get("price", 0) + (i % 2)}
+                        for i, doc in enumerate(documents)))
+    client.bulk_update_documents_with_session(session, path, PROJECT_ID, DATABASE_ID, "bench_documents",
+                                              server.endpoint, concurrency=args.concurrency)
+    return {"docs": len(documents)}
+
+
+def relationships(client, server, session, args, workdir):
+    count = max(1, args.documents // 10)
+    lines = ["Children:"]
+    for i in range(count):
+        lines += ["  - collection_name: City", f"    data: &city{i}", f"      name: City {i}"]
+    lines.append("Parent:")
+    for i in range(count):
+        lines += ["  - collection_name: Property", "    data:", f"      title: Property {i}",
+                  f"      city: {{value: *city{i}, relation: manyToOne}}"]
+    path = workdir / "relationships.yaml"
+    path.write_text("\n".join(lines) + "\n")
+    mapping = {"City": "bench_cities", "Property": "bench_properties"}
+    client.create_documents_with_relationships(session, path, PROJECT_ID, DATABASE_ID, mapping, server.endpoint,
+                                               concurrency=args.concurrency)
+    return {"docs": len(server.collection("bench_cities")) + len(server.collection("bench_properties"))}
+
+
+def upload(client, server, session, args, workdir):
+    folder = workdir / "upload"
+    folder.mkdir()
+    total = 0
+    for i in range(args.files):
+        # Mix small and large files, like a folder of images and videos
+        size = args.file_kb * 1024 * (4 if i % 5 == 0 else 1)
+        (folder / f"file-{i:05}.bin").write_bytes(os.urandom(size))
+        total += size
+    client.bulk_upload_files_from_folder(session, PROJECT_ID, "bench_bucket", folder, server.endpoint,
+                                         workers=args.upload_workers)
+    return {"files": len(server.bucket("bench_bucket")), "bytes": total}
+
+
+def mirror(client, server, session, args, workdir):
+    if not server.bucket("bench_bucket"):
+        upload(client, server, session, args, workdir)
+    counts = client.mirror_bucket(session, PROJECT_ID, "bench_bucket", server.endpoint, workdir / "mirror",
+                                  workers=args.upload_workers)
+    total = sum(len(record["content"]) for record in server.bucket("bench_bucket").values())
+    return {"files": counts["downloaded"], "bytes": total}
+
+
+def delete(client, server, session, args, workdir):
+    if not server.collection("bench_documents"):
+        bulk_create(client, server, session, args, workdir)
+    deleted = client.delete_all_documents_with_session(session, PROJECT_ID, DATABASE_ID, "bench_documents",
+                                                       server.endpoint, concurrency=args.concurrency,
+                                                       use_bulk=not args.no_bulk_delete)
+    return {"docs": deleted}
+
+
+def run_scenario(name, client, server, session, recorder, args, workdir):
+    """Run one scenario with fresh rate limiter and retry state and return its metrics"""
+    client._default_rate_limiter = None
+    client._default_retry_policy = None
+    if args.max_rate:
+        client.get_default_rate_limiter().max_rate = args.max_rate
+    recorder.reset()
+    requests_before = server.request_count
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    started = time.perf_counter()
+    with output:
+        units = globals()[name](client, server, session, args, workdir)
+    seconds = time.perf_counter() - started
+    metrics = {"seconds": round(seconds, 3), "requests": server.request_count - requests_before}
+    if "docs" in units:
+        metrics["docs_per_sec"] = round(units["docs"] / seconds, 1)
+    if "files" in units:
+        metrics["files_per_sec"] = round(units["files"] / seconds, 1)
+    if "bytes" in units:
+        metrics["mb_per_sec"] = round(units["bytes"] / (1024 * 1024) / seconds, 2)
+    for percent in (50, 99):
+        value = recorder.percentile(percent)
+        metrics[f"p{percent}_ms"] = round(value * 1000, 2) if value is not None else None
+    return metrics
+
+
+def print_results(results, baseline=None):
+    print(f"\n{'scenario':<15}{'seconds':>9}{'requests':>10}{'docs/s':>10}{'files/s':>9}{'MB/s':>8}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, metrics in results.items():
+        cells = [metrics.get(key) for key in ("docs_per_sec", "files_per_sec", "mb_per_sec", "p50_ms", "p99_ms")]
+        cells = ["-" if value is None else value for value in cells]
+        print(f"{name:<15}{metrics['seconds']:>9}{metrics['requests']:>10}"
+              f"{cells[0]:>10}{cells[1]:>9}{cells[2]:>8}{cells[3]:>9}{cells[4]:>9}")
+    if not baseline:
+        return
+    print("\nChange against baseline (positive is better):")
+    for name, metrics in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        changes = []
+        for key in COMPARED_METRICS:
+            old, new = previous.get(key), metrics.get(key)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            if key.endswith("_ms"):
+                change = -change
+            changes.append(f"{key} {old} -> {new} ({change:+.1f}%)")
+        print(f"  {name}: {'; '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark appwrite-client.py against a local mock Appwrite server")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS), help="Scenarios to run (default: all)")
+    parser.add_argument("--documents", type=int, default=2000, help="Documents per document scenario (default: 2000)")
+    parser.add_argument("--files", type=int, default=100, help="Files to upload and mirror (default: 100)")
+    parser.add_argument("--file-kb", type=int, default=256, help="Size of the small files in KB; every fifth file is 4x larger (default: 256)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Workers for document scenarios (default: 8)")
+    parser.add_argument("--upload-workers", type=int, default=4, help="Workers for upload and mirror (default: 4)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Bulk create batch size, 0 for one request per document (default: 100)")
+    parser.add_argument("--no-bulk-delete", action="store_true", help="Delete documents one request at a time")
+    parser.add_argument("--max-rate", type=float, help="Upper bound for the client's adaptive rate limiter")
+    parser.add_argument("--latency", type=float, default=0.005, help="Seconds the mock server adds to each request (default: 0.005)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests the mock answers with HTTP 503")
+    parser.add_argument("--rate-limit", type=int, help="Requests per second the mock allows before answering 429")
+    parser.add_argument("--no-bulk", action="store_true", help="Make the mock reject the bulk documents endpoints like older servers")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the mock's random errors (default: 1)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Compare with results previously saved with --output")
+    parser.add_argument("--verbose", action="store_true", help="Show the client's own output")
+    args = parser.parse_args()
+    args.batch_size = args.batch_size or None
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+
+    client = load_client()
+    recorder = LatencyRecorder()
+    results = {}
+    with MockAppwriteServer(latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit,
+                            supports_bulk=not args.no_bulk, seed=args.seed) as server:
+        with contextlib.redirect_stdout(io.StringIO()):
+            session = client.create_session("benchmark@example.com", "password", PROJECT_ID, server.endpoint)
+        session.hooks["response"].append(recorder.hook)
+        with tempfile.TemporaryDirectory() as workdir:
+            for name in args.scenarios:
+                print(f"Running {name}...", file=sys.stderr)
+                scenario_dir = Path(workdir) / name
+                scenario_dir.mkdir()
+                results[name] = run_scenario(name, client, server, session, recorder, args, scenario_dir)
+
+    print_results(results, baseline)
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "verbose")},
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""In-process stand-in for the Appwrite REST endpoints used by appwrite-client.py.
+
+Implements the session, database, collection, document and storage routes the
+client calls, keeping everything in memory. Latency, random 5xx errors and
+429 rate limiting can be configured, so the client's concurrency, retry and
+back-off behaviour can be exercised without a real Appwrite server:
+
+    with MockAppwriteServer(latency=0.005, error_rate=0.01) as server:
+        session = create_session("user@example.com", "password", "project", server.endpoint)
+"""
+import email
+import email.policy
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _new_id():
+    return uuid.uuid4().hex[:20]
+
+
+def _parse_query(raw):
+    try:
+        query = json.loads(raw)
+        return query.get("method"), query.get("attribute"), query.get("values", [])
+    except ValueError:
+        return None, None, []
+
+
+def _apply_queries(items, queries, search=None):
+    """Filter, order and paginate a list of records with Appwrite JSON queries."""
+    limit = 25
+    offset = 0
+    cursor_after = None
+    select = None
+    order = None
+    filtered = list(items)
+    if search:
+        filtered = [item for item in filtered if search in item.get("name", "")]
+    for raw in queries:
+        method, attribute, values = _parse_query(raw)
+        if method == "limit":
+            limit = int(values[0])
+        elif method == "offset":
+            offset = int(values[0])
+        elif method == "cursorAfter":
+            cursor_after = values[0]
+        elif method == "select":
+            select = values
+        elif method in ("orderAsc", "orderDesc"):
+            order = (attribute, method == "orderDesc")
+        elif method == "equal":
+            filtered = [item for item in filtered if item.get(attribute) in values]
+        elif method == "greaterThanEqual":
+            filtered = [item for item in filtered if str(item.get(attribute, "")) >= str(values[0])]
+        elif method == "greaterThan":
+            filtered = [item for item in filtered if str(item.get(attribute, "")) > str(values[0])]
+        elif method == "lessThan":
+            filtered = [item for item in filtered if str(item.get(attribute, "")) < str(values[0])]
+    if order:
+        attribute, descending = order
+        filtered.sort(key=lambda item: (str(item.get(attribute, "")), item["$id"]), reverse=descending)
+    total = len(filtered)
+    if cursor_after is not None:
+        ids = [item["$id"] for item in filtered]
+        if cursor_after not in ids:
+            return None, total
+        filtered = filtered[ids.index(cursor_after) + 1:]
+    page = filtered[offset:offset + limit]
+    if select:
+        page = [{key: value for key, value in item.items() if key in select or key.startswith("$")}
+                for item in page]
+    return page, total
+
+
+class MockAppwriteServer:
+    """Threaded HTTP server that keeps collections and buckets in memory.
+
+    latency: seconds added to every request.
+    error_rate: probability of answering a request with HTTP 503.
+    rate_limit: requests allowed per rate_window seconds before answering 429.
+    supports_bulk: accept the batched documents create/delete endpoints.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, rate_limit=None, rate_window=1.0,
+                 supports_bulk=True, max_batch=100, chunk_size=5 * 1024 * 1024, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.supports_bulk = supports_bulk
+        self.max_batch = max_batch
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.collections = {}
+        self.attributes = {}
+        self.buckets = {}
+        self.sessions = set()
+        self.request_count = 0
+        self.login_count = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        handler = type("Handler", (_Handler,), {"mock": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def collection(self, collection_id, attributes=None):
+        """Return a collection's document map (ID -> document), creating it if needed.
+
+        attributes, e.g. [{"key": "price", "type": "double"}], are reported by the
+        collection's GET route like Appwrite's attribute definitions.
+        """
+        if attributes is not None:
+            self.attributes[collection_id] = attributes
+        return self.collections.setdefault(collection_id, {})
+
+    def bucket(self, bucket_id):
+        """Return a bucket's file map (ID -> {"meta", "content"}), creating it if needed"""
+        return self.buckets.setdefault(bucket_id, {})
+
+    def _rate_limited(self):
+        if not self.rate_limit:
+            return None
+        with self.lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            remaining = max(0, self.rate_limit - self._window_count)
+            reset = int(time.time() + self.rate_window - (now - self._window_start)) + 1
+            return self._window_count > self.rate_limit, remaining, reset
+
+
+class _Handler(BaseHTTPRequestHandler):
+    mock = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        payload = b"" if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode())
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if body is not None and not isinstance(body, bytes):
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def _error(self, status, message, error_type="general_argument_invalid", headers=None):
+        self._send(status, {"message": message, "code": status, "type": error_type}, headers)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _json(self, raw):
+        try:
+            return json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+
+    def _authorized(self):
+        if self.headers.get("X-Appwrite-Key"):
+            return True
+        cookie = self.headers.get("Cookie", "")
+        return any(token in cookie for token in self.mock.sessions)
+
+    def _handle(self, method):
+        mock = self.mock
+        body = self._body()
+        with mock.lock:
+            mock.request_count += 1
+        if mock.latency:
+            time.sleep(mock.latency)
+        limit_headers = {}
+        limited = mock._rate_limited()
+        if limited:
+            is_limited, remaining, reset = limited
+            limit_headers = {
+                "X-RateLimit-Limit": str(mock.rate_limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(reset),
+            }
+            if is_limited:
+                return self._error(429, "Rate limit for the current endpoint has been exceeded.",
+                                   "general_rate_limit_exceeded", limit_headers)
+        if mock.error_rate and mock.random.random() < mock.error_rate:
+            return self._error(503, "Service unavailable", "general_server_error", limit_headers)
+
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        parts = [p for p in parsed.path.split("/") if p]
+        if parts and parts[0] == "v1":
+            parts = parts[1:]
+        self._limit_headers = limit_headers
+
+        if parts == ["account", "sessions", "email"] and method == "POST":
+            token = uuid.uuid4().hex
+            with mock.lock:
+                mock.sessions.add(token)
+                mock.login_count += 1
+            project = self.headers.get("X-Appwrite-Project", "")
+            expire = (datetime.now(timezone.utc) + timedelta(days=365)).isoformat()
+            headers = dict(limit_headers)
+            headers["Set-Cookie"] = f"a_session_{project}={token}; Path=/; HttpOnly"
+            return self._send(201, {"$id": _new_id(), "expire": expire}, headers)
+
+        if not self._authorized():
+            return self._error(401, "User (role: guests) missing scope", "general_unauthorized_scope")
+
+        if parts == ["account"]:
+            return self._send(200, {"$id": "user", "email": "mock@example.com"}, limit_headers)
+        if parts and parts[0] == "databases":
+            return self._databases(method, parts[1:], params, body)
+        if parts[:2] == ["storage", "buckets"]:
+            return self._storage(method, parts[2:], params, body)
+        return self._error(404, "Route not found", "general_route_not_found")
+
+    def _databases(self, method, parts, params, body):
+        mock = self.mock
+        headers = self._limit_headers
+        if not parts:
+            return self._send(200, {"total": 1, "databases": [{"$id": "db", "name": "db"}]}, headers)
+        database_id = parts[0]
+        if len(parts) == 1:
+            return self._send(200, {"$id": database_id, "name": database_id}, headers)
+        if len(parts) == 2:
+            collections = [{"$id": cid, "name": cid} for cid in mock.collections]
+            return self._send(200, {"total": len(collections), "collections": collections}, headers)
+        collection_id = parts[2]
+        if len(parts) == 3:
+            attributes = mock.attributes.get(collection_id, [])
+            return self._send(200, {"$id": collection_id, "name": collection_id, "attributes": attributes}, headers)
+        with mock.lock:
+            documents = mock.collection(collection_id)
+            if len(parts) == 4:
+                if method == "GET":
+                    page, total = _apply_queries(documents.values(), params.get("queries[]", []))
+                    if page is None:
+                        return self._error(400, "Document for the 'cursor' value not found.")
+                    return self._send(200, {"total": total, "documents": page}, headers)
+                if method == "POST":
+                    payload = self._json(body)
+                    if "documents" in payload:
+                        if not mock.supports_bulk:
+                            return self._error(400, 'Param "documentId" is not optional.')
+                        if len(payload["documents"]) > mock.max_batch:
+                            return self._error(400, "Batch too large")
+                        # Batches are atomic: validate every item before storing any
+                        staged = []
+                        for item in payload["documents"]:
+                            item = dict(item)
+                            doc_id = item.pop("$id", None) or "unique()"
+                            if doc_id == "unique()":
+                                doc_id = _new_id()
+                            if doc_id in documents or doc_id in [sid for sid, _ in staged]:
+                                return self._error(409, "Document with the requested ID already exists.",
+                                                   "document_already_exists")
+                            staged.append((doc_id, item))
+                        created = [self._store(documents, doc_id, collection_id, database_id, item)
+                                   for doc_id, item in staged]
+                        return self._send(201, {"total": len(created), "documents": created}, headers)
+                    doc_id = payload.get("documentId")
+                    if not doc_id:
+                        return self._error(400, 'Param "documentId" is not optional.')
+                    if doc_id == "unique()":
+                        doc_id = _new_id()
+                    if doc_id in documents:
+                        return self._error(409, "Document with the requested ID already exists.",
+                                           "document_already_exists")
+                    doc = self._store(documents, doc_id, collection_id, database_id, payload.get("data") or {})
+                    return self._send(201, doc, headers)
+                if method == "DELETE":
+                    if not mock.supports_bulk:
+                        return self._error(404, "Route not found", "general_route_not_found")
+                    payload = self._json(body)
+                    # Without a limit every matching document goes; the client's limit wins
+                    queries = [json.dumps({"method": "limit", "values": [10 ** 9]})] + list(payload.get("queries", []))
+                    page, _ = _apply_queries(documents.values(), queries)
+                    for doc in page or []:
+                        documents.pop(doc["$id"], None)
+                    return self._send(200, {"total": len(page or []), "documents": page or []}, headers)
+            document_id = parts[4]
+            doc = documents.get(document_id)
+            if doc is None:
+                return self._error(404, "Document with the requested ID could not be found.", "document_not_found")
+            if method == "GET":
+                return self._send(200, doc, headers)
+            if method == "PATCH":
+                doc.update(self._json(body).get("data") or {})
+                doc["$updatedAt"] = _now()
+                return self._send(200, doc, headers)
+            if method == "DELETE":
+                documents.pop(document_id)
+                return self._send(204, None, headers)
+        return self._error(405, "Method not allowed")
+
+    def _store(self, documents, doc_id, collection_id, database_id, data):
+        now = _now()
+        doc = dict(data)
+        doc.update({"$id": doc_id, "$collectionId": collection_id, "$databaseId": database_id,
+                    "$createdAt": now, "$updatedAt": now, "$permissions": []})
+        documents[doc_id] = doc
+        return doc
+
+    def _storage(self, method, parts, params, body):
+        mock = self.mock
+        headers = self._limit_headers
+        if not parts:
+            return self._error(404, "Route not found", "general_route_not_found")
+        bucket_id = parts[0]
+        with mock.lock:
+            files = mock.bucket(bucket_id)
+        if len(parts) == 1:
+            return self._send(200, {"$id": bucket_id, "name": bucket_id}, headers)
+        if len(parts) == 2:
+            if method == "GET":
+                with mock.lock:
+                    records = [record["meta"] for record in files.values()]
+                    search = (params.get("search") or [None])[0]
+                    page, total = _apply_queries(records, params.get("queries[]", []), search)
+                if page is None:
+                    return self._error(400, "File for the 'cursor' value not found.")
+                return self._send(200, {"total": total, "files": page}, headers)
+            if method == "POST":
+                return self._upload(files, bucket_id, body)
+        file_id = parts[2]
+        with mock.lock:
+            record = files.get(file_id)
+        if record is None:
+            return self._error(404, "The requested file could not be found.", "storage_file_not_found")
+        if len(parts) == 3:
+            if method == "GET":
+                return self._send(200, record["meta"], headers)
+            if method == "DELETE":
+                with mock.lock:
+                    files.pop(file_id, None)
+                return self._send(204, None, headers)
+        if len(parts) == 4 and parts[3] == "download":
+            content = bytes(record["content"])
+            start = 0
+            status = 200
+            range_header = self.headers.get("Range")
+            response_headers = dict(headers)
+            response_headers["Content-Type"] = record["meta"]["mimeType"]
+            if range_header and range_header.startswith("bytes="):
+                start = int(range_header[6:].split("-")[0] or 0)
+                status = 206
+                response_headers["Content-Range"] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+            return self._send(status, content[start:], response_headers)
+        return self._error(405, "Method not allowed")
+
+    def _upload(self, files, bucket_id, body):
+        mock = self.mock
+        headers = self._limit_headers
+        message = email.message_from_bytes(
+            b"Content-Type: " + self.headers.get("Content-Type", "").encode() + b"\r\n\r\n" + body,
+            policy=email.policy.HTTP,
+        )
+        fields = {}
+        upload = None
+        filename = None
+        mime_type = "application/octet-stream"
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                upload = part.get_payload(decode=True) or b""
+                filename = part.get_filename()
+                mime_type = part.get_content_type()
+            else:
+                fields[name] = part.get_payload(decode=True).decode()
+        if upload is None:
+            return self._error(400, 'Param "file" is not optional.')
+
+        content_range = self.headers.get("Content-Range")
+        total_size = len(upload)
+        start = 0
+        if content_range:
+            span, total = content_range.replace("bytes ", "").split("/")
+            start = int(span.split("-")[0])
+            total_size = int(total)
+        file_id = self.headers.get("x-appwrite-id") or fields.get("fileId") or "unique()"
+        if file_id == "unique()":
+            file_id = _new_id()
+        chunks_total = max(1, -(-total_size // mock.chunk_size))
+
+        with mock.lock:
+            record = files.get(file_id)
+            if record is None:
+                now = _now()
+                record = {
+                    "content": bytearray(total_size),
+                    "received": set(),
+                    "meta": {
+                        "$id": file_id, "bucketId": bucket_id, "name": filename,
+                        "$createdAt": now, "$updatedAt": now, "$permissions": [],
+                        "mimeType": mime_type, "sizeOriginal": total_size, "signature": "",
+                        "chunksTotal": chunks_total, "chunksUploaded": 0,
+                    },
+                }
+                files[file_id] = record
+            elif not content_range:
+                return self._error(409, "A storage file with the requested ID already exists.",
+                                   "storage_file_already_exists")
+            record["content"][start:start + len(upload)] = upload
+            record["received"].add(start)
+            meta = record["meta"]
+            meta["chunksUploaded"] = len(record["received"])
+            meta["$updatedAt"] = _now()
+            if meta["chunksUploaded"] >= chunks_total:
+                meta["signature"] = hashlib.md5(bytes(record["content"])).hexdigest()
+            return self._send(201, dict(meta), headers)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")